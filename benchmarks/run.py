@@ -0,0 +1,289 @@
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from graph_state import GraphState
+
+########################################################
+# Workloads
+#
+# Each builds a prepared state of roughly `n` qubits.
+########################################################
+
+def random_circuit(n, degree, rng):
+  g = GraphState(n, rng=rng)
+  for i in range(n):
+    g.h(i)
+  for _ in range(n * degree // 2):
+    a, b = rng.sample(range(n), 2)
+    g.apply(rng.randrange(24), a)
+    g.cz(a, b)
+  return g
+
+def ghz(n, degree, rng):
+  # The graph form of H(0) CX(0, 1) ... CX(0, n-1): a star whose leaves
+  # carry a Hadamard. Building it gate by gate would spend O(n^3) on
+  # reductions of the hub and swamp every other case.
+  g = GraphState(n, rng=rng)
+  g.vops[0] = 0
+  for leaf in range(1, n):
+    g.add_edge(0, leaf)
+  return g
+
+def cluster_1d(n, degree, rng):
+  g = GraphState(n, rng=rng)
+  for i in range(n):
+    g.h(i)
+  for i in range(n - 1):
+    g.cz(i, i + 1)
+  return g
+
+def cluster_2d(n, degree, rng):
+  side = max(2, int(math.sqrt(n)))
+  g = GraphState(side * side, rng=rng)
+  for i in range(side * side):
+    g.h(i)
+  for row in range(side):
+    for col in range(side):
+      i = row * side + col
+      if col + 1 < side:
+        g.cz(i, i + 1)
+      if row + 1 < side:
+        g.cz(i, i + side)
+  return g
+
+def star(n, degree, rng):
+  # `n` disjoint stars with `degree` leaves each, built edge by edge
+  g = GraphState(n, rng=rng)
+  for i in range(n):
+    g.h(i)
+  for hub in range(0, n, degree + 1):
+    for leaf in range(hub + 1, min(hub + degree + 1, n)):
+      g.add_edge(hub, leaf)
+  return g
+
+WORKLOADS = {
+  'random': random_circuit,
+  'ghz': ghz,
+  'cluster1d': cluster_1d,
+  'cluster2d': cluster_2d,
+  'star': star,
+}
+
+########################################################
+# Benchmarks
+#
+# Each takes a prepared state and returns a callable that
+# performs one operation per call, or a pair `(setup, op)`
+# where `op(setup())` performs one and only `op` is timed.
+########################################################
+
+def bench_cz(g, rng):
+  n = g.num_nodes
+  return lambda: g.cz(*rng.sample(range(n), 2))
+
+def bench_measure(basis):
+  # Measuring collapses the state, so every op measures a fresh fork of it
+  def bench(g, rng):
+    n = g.num_nodes
+    return g.fork, lambda state: state.measure(rng.randrange(n), basis)
+  return bench
+
+def bench_reduce_vop(g, rng):
+  connected = [a for a in range(g.num_nodes) if g.degree(a)]
+
+  def op():
+    if not connected:
+      return
+    a = rng.choice(connected)
+    ngbh = g.neighbors(a)
+    if ngbh:
+      g.apply(rng.randrange(24), a)
+      g.reduce_vop(a, ngbh[0])
+  return op
+
+def bench_local_complementation(g, rng):
+  connected = [a for a in range(g.num_nodes) if g.degree(a)] or [0]
+  return lambda: g.local_complementation(rng.choice(connected))
+
+def bench_edges(g, rng):
+  return lambda: deque(g.edges(), maxlen=0)
+
+def bench_edge_array(g, rng):
+  return g.edge_array
+
+BENCHMARKS = {
+  'cz': bench_cz,
+  'measure_x': bench_measure('X'),
+  'measure_y': bench_measure('Y'),
+  'measure_z': bench_measure('Z'),
+  'reduce_vop': bench_reduce_vop,
+  'local_complementation': bench_local_complementation,
+  'edges': bench_edges,
+  'edge_array': bench_edge_array,
+}
+
+########################################################
+# Runner
+########################################################
+
+# Random circuits scramble into dense graphs, so preparing one costs about
+# n CZs of O(n * degree) each; bigger cases are left to the structured workloads
+RANDOM_MAX_WORK = 4 * 10 ** 6
+
+# Wall time a case may spend, setup included, in multiples of `--min-time`
+MAX_WALL_TIME = 10
+
+def cases(max_qubits, degrees):
+  sizes = [10 ** k for k in range(1, 7) if 10 ** k <= max_qubits]
+  for workload in WORKLOADS:
+    for n in sizes:
+      for degree in (degrees if workload in ('random', 'star') else [None]):
+        if workload == 'random' and n * n * degree > RANDOM_MAX_WORK:
+          continue
+        if degree is None or degree < n:
+          yield workload, n, degree
+
+def prepare(workload, n, degree, seed, memory):
+  # Builds the workload once; every benchmark then runs on a fork of it.
+  # Returns the state and the peak memory traced while building it.
+  # Tracing allocations slows the build down but never the timed ops.
+  if memory:
+    tracemalloc.start()
+  g = WORKLOADS[workload](n, degree or 2, random.Random(seed))
+  peak = None
+  if memory:
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+  return g, peak
+
+def time_ops(op, min_time, max_ops):
+  if isinstance(op, tuple):
+    return time_setup_ops(op[0], op[1], min_time, max_ops)
+
+  ops = 0
+  start = time.perf_counter()
+  elapsed = 0.0
+  while (elapsed < min_time or ops == 0) and ops < max_ops:
+    op()
+    ops += 1
+    elapsed = time.perf_counter() - start
+
+  return {'ops': ops, 'seconds': elapsed, 'ops_per_sec': ops / elapsed if elapsed else None}
+
+def time_setup_ops(setup, op, min_time, max_ops):
+  # Times each op on its own, leaving out the setup before it
+  ops = 0
+  elapsed = 0.0
+  deadline = time.perf_counter() + MAX_WALL_TIME * min_time
+  while (elapsed < min_time or ops == 0) and ops < max_ops:
+    arg = setup()
+    start = time.perf_counter()
+    op(arg)
+    elapsed += time.perf_counter() - start
+    ops += 1
+    if start > deadline:
+      break
+
+  return {'ops': ops, 'seconds': elapsed, 'ops_per_sec': ops / elapsed if elapsed else None}
+
+def commit():
+  try:
+    return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                   cwd=os.path.dirname(os.path.abspath(__file__)),
+                                   stderr=subprocess.DEVNULL).decode().strip()
+  except (OSError, subprocess.CalledProcessError):
+    return None
+
+def run(args):
+  results = []
+  for workload, n, degree in cases(args.max_qubits, args.degrees):
+    benchmarks = [b for b in BENCHMARKS if not args.only or b in args.only or workload in args.only]
+    if not benchmarks:
+      continue
+
+    prepared, peak = prepare(workload, n, degree, args.seed, args.memory)
+    for benchmark in benchmarks:
+      rng = random.Random(args.seed)
+      g = prepared.fork()
+      g.rng = rng
+
+      result = {'benchmark': benchmark, 'workload': workload, 'qubits': n, 'degree': degree,
+                'state_bytes': prepared.nbytes(), 'build_peak_bytes': peak}
+      result.update(time_ops(BENCHMARKS[benchmark](g, rng), args.min_time, args.max_ops))
+      results.append(result)
+
+      print('{:<22} {:<10} n={:<8} d={:<5} {:>12.5g} ops/s'.format(
+        benchmark, workload, n, degree or '-', result['ops_per_sec'] or 0))
+
+  report = {
+    'commit': commit(),
+    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    'python': platform.python_version(),
+    'machine': platform.machine(),
+    'seed': args.seed,
+    'results': results,
+  }
+
+  output = args.output or os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results',
+                                       '{}.json'.format(report['commit'] or 'latest'))
+  os.makedirs(os.path.dirname(output), exist_ok=True)
+  with open(output, 'w') as f:
+    json.dump(report, f, indent=2)
+  print('Wrote {}'.format(output))
+
+def compare(old_path, new_path, threshold):
+  with open(old_path) as f:
+    old = json.load(f)
+  with open(new_path) as f:
+    new = json.load(f)
+
+  key = lambda r: (r['benchmark'], r['workload'], r['qubits'], r['degree'])
+  baseline = {key(r): r for r in old['results']}
+
+  regressions = 0
+  for result in new['results']:
+    before = baseline.get(key(result))
+    if not before or not before['ops_per_sec'] or not result['ops_per_sec']:
+      continue
+
+    ratio = result['ops_per_sec'] / before['ops_per_sec']
+    flag = ''
+    if ratio < 1 - threshold:
+      flag = '  REGRESSION'
+      regressions += 1
+    print('{:<22} {:<10} n={:<8} d={:<5} {:>7.2f}x{}'.format(
+      result['benchmark'], result['workload'], result['qubits'], result['degree'] or '-', ratio, flag))
+
+  return regressions
+
+def main():
+  parser = argparse.ArgumentParser(description='Benchmark the graph state hot paths.')
+  parser.add_argument('--max-qubits', type=int, default=10 ** 4)
+  parser.add_argument('--degrees', type=int, nargs='+', default=[4, 16, 64])
+  parser.add_argument('--min-time', type=float, default=0.2, help='seconds spent timing each case')
+  parser.add_argument('--max-ops', type=int, default=1000, help='caps how far each case drifts from its workload')
+  parser.add_argument('--seed', type=int, default=0)
+  parser.add_argument('--only', nargs='+', help='benchmark or workload names to run')
+  parser.add_argument('--no-memory', dest='memory', action='store_false', help='skip tracing the peak memory of building each state')
+  parser.add_argument('--output', help='JSON file, defaults to benchmarks/results/<commit>.json')
+  parser.add_argument('--compare', nargs=2, metavar=('OLD', 'NEW'))
+  parser.add_argument('--threshold', type=float, default=0.1, help='slowdown flagged by --compare')
+  args = parser.parse_args()
+
+  if args.compare:
+    sys.exit(1 if compare(args.compare[0], args.compare[1], args.threshold) else 0)
+  run(args)
+
+if __name__ == '__main__':
+  main()
@@ -1,15 +1,13 @@
 from graph_state import GraphState
 from collections import Counter
 
-results = []
-for i in range(1000):
-  g = GraphState(2)
-  g.h(0)
-  g.cx(0, 1)
+g = GraphState(2)
+g.h(0)
+g.cx(0, 1)
 
-  if i == 0:
-    g.draw()
+g.draw()
 
-  results.append(str(g.measure(0)) + str(g.measure(1)))
+# Prepare once, then sample 1000 shots without disturbing the state
+samples = g.sample([0, 1], 1000)
 
-print(Counter(results))
\ No newline at end of file
+print(Counter(''.join(map(str, shot)) for shot in samples))
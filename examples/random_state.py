@@ -1,10 +1,11 @@
-from graph_state import GraphState
+from graph_state import GraphState, Circuit
 import random
 
 # Use 30 qubits
 num_qubits = 30
 
 g = GraphState(num_qubits)
+circuit = Circuit()
 
 # Apply 300000 operations
 for i in range(300000):
@@ -12,11 +13,13 @@ for i in range(300000):
 
   if use_cz:
     control, target = random.sample(range(num_qubits), 2)
-    g.cz(control, target)
+    circuit.cz(control, target)
   else:
     operator = random.choice(range(24))
     target = random.choice(range(num_qubits))
-    g.apply(operator, target)
+    circuit.apply(operator, target)
+
+g.run(circuit)
 
 g.draw()
 
@@ -24,4 +27,4 @@ g.draw()
 # for i in range(num_qubits):
 #   outcome += str(g.measure(i))
 
-# print(outcome)
\ No newline at end of file
+# print(outcome)
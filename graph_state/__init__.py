@@ -1 +1,4 @@
-from .graph_state import GraphState
\ No newline at end of file
+from .graph_state import GraphState
+from .circuit import Circuit
+from .circuit_file import read_circuit, run_file, read_measurements
+from .shots import run_shots, run_components
\ No newline at end of file
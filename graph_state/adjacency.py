@@ -0,0 +1,307 @@
+import sys
+from array import array
+from bisect import bisect_left
+
+########################################################
+# Adjacency backends
+#
+# Every backend stores an undirected simple graph on the
+# vertices 0..n-1 and exposes the same interface.
+########################################################
+
+class SparseAdjacency(object):
+  # Each vertex owns a sorted `int32` array of neighbours, or `None`
+  # while it is isolated, so a product state costs one pointer per qubit.
+
+  def __init__(self, num_nodes):
+    self.num_nodes = num_nodes
+    self.rows = [None] * num_nodes
+
+  def row(self, a):
+    return self.rows[a] or array('i')
+
+  def neighbors(self, a):
+    row = self.rows[a]
+    return list(row) if row else []
+
+  def degree(self, a):
+    row = self.rows[a]
+    return len(row) if row else 0
+
+  def has_edge(self, a, b):
+    row = self.rows[a]
+    if not row:
+      return False
+    i = bisect_left(row, b)
+    return i < len(row) and row[i] == b
+
+  def copy(self):
+    other = SparseAdjacency.__new__(SparseAdjacency)
+    other.num_nodes = self.num_nodes
+    other.rows = list(self.rows)
+    return other
+
+  # Rows are never modified in place, so copies share them until written
+
+  def _insert(self, a, b):
+    row = self.rows[a]
+    if row is None:
+      self.rows[a] = array('i', [b])
+      return
+    i = bisect_left(row, b)
+    if i == len(row) or row[i] != b:
+      row = array('i', row)
+      row.insert(i, b)
+      self.rows[a] = row
+
+  def _delete(self, a, b):
+    row = self.rows[a]
+    i = bisect_left(row, b) if row else 0
+    if not row or i == len(row) or row[i] != b:
+      raise KeyError((a, b))
+    if len(row) == 1:
+      self.rows[a] = None
+    else:
+      row = array('i', row)
+      del row[i]
+      self.rows[a] = row
+
+  # Adding an edge twice leaves one edge, removing a missing edge raises
+  # KeyError and changes nothing
+
+  def add_edge(self, a, b):
+    self._insert(a, b)
+    self._insert(b, a)
+
+  def remove_edge(self, a, b):
+    if not self.has_edge(a, b):
+      raise KeyError((a, b))
+    self._delete(a, b)
+    self._delete(b, a)
+
+  def toggle_edge(self, a, b):
+    if self.has_edge(a, b):
+      self.remove_edge(a, b)
+    else:
+      self.add_edge(a, b)
+
+  def set_row(self, a, row):
+    # Replaces the neighbours of `a`; the caller keeps the graph symmetric
+    self.rows[a] = array('i', row) if len(row) else None
+
+  def _xor_row(self, a, others):
+    row = set(self.rows[a] or ())
+    row.symmetric_difference_update(others)
+    row.discard(a)
+    self.rows[a] = array('i', sorted(row)) if row else None
+
+  def complement(self, vertices):
+    # Toggle every edge between two distinct members of `vertices`
+    vertices = set(vertices)
+    for a in vertices:
+      self._xor_row(a, vertices)
+
+  def toggle_bipartite(self, a, b):
+    # Toggle every edge {i, j} with i in `a`, j in `b` and i != j, once
+    a, b = set(a), set(b)
+    union = a | b
+    for v in union:
+      if v in a:
+        self._xor_row(v, union if v in b else b)
+      else:
+        self._xor_row(v, a)
+
+  def edges(self):
+    for a, row in enumerate(self.rows):
+      if row:
+        for b in row[bisect_left(row, a):]:
+          yield a, b
+
+  def csr(self):
+    return csr_arrays(self.rows)
+
+  def nbytes(self):
+    size = sys.getsizeof(self.rows)
+    for row in self.rows:
+      if row:
+        size += sys.getsizeof(row)
+    return size
+
+
+class BitsetAdjacency(object):
+  # Each vertex owns a Python int used as a bitset over all vertices.
+  # Only sensible for small `n`, where a row fits in a few machine words.
+
+  def __init__(self, num_nodes):
+    self.num_nodes = num_nodes
+    self.rows = [0] * num_nodes
+
+  def copy(self):
+    # Rows are immutable ints, so the copy shares them until written
+    other = BitsetAdjacency.__new__(BitsetAdjacency)
+    other.num_nodes = self.num_nodes
+    other.rows = list(self.rows)
+    return other
+
+  def row(self, a):
+    return array('i', bits(self.rows[a]))
+
+  def neighbors(self, a):
+    return list(bits(self.rows[a]))
+
+  def degree(self, a):
+    return bin(self.rows[a]).count('1')
+
+  def has_edge(self, a, b):
+    return ((self.rows[a] >> b) & 1) == 1
+
+  def add_edge(self, a, b):
+    self.rows[a] |= 1 << b
+    self.rows[b] |= 1 << a
+
+  def remove_edge(self, a, b):
+    if not self.has_edge(a, b):
+      raise KeyError((a, b))
+    self.rows[a] &= ~(1 << b)
+    self.rows[b] &= ~(1 << a)
+
+  def toggle_edge(self, a, b):
+    self.rows[a] ^= 1 << b
+    self.rows[b] ^= 1 << a
+
+  def set_row(self, a, row):
+    self.rows[a] = to_mask(row)
+
+  def complement(self, vertices):
+    mask = to_mask(vertices)
+    for a in bits(mask):
+      self.rows[a] ^= mask & ~(1 << a)
+
+  def toggle_bipartite(self, a, b):
+    mask_a, mask_b = to_mask(a), to_mask(b)
+    union = mask_a | mask_b
+    both = mask_a & mask_b
+    for v in bits(union):
+      bit = 1 << v
+      if both & bit:
+        self.rows[v] ^= union & ~bit
+      elif mask_a & bit:
+        self.rows[v] ^= mask_b
+      else:
+        self.rows[v] ^= mask_a
+
+  def edges(self):
+    for a, row in enumerate(self.rows):
+      for b in bits(row >> (a + 1)):
+        yield a, a + 1 + b
+
+  def csr(self):
+    return csr_arrays([self.row(a) for a in range(self.num_nodes)])
+
+  def nbytes(self):
+    return sys.getsizeof(self.rows) + sum(sys.getsizeof(row) for row in self.rows)
+
+
+class CSRAdjacency(object):
+  # Read-only compressed sparse rows: the sorted neighbours of `a` are
+  # `indices[offsets[a]:offsets[a + 1]]`. Backs checkpoints mapped from
+  # disk, where both are memoryviews of the file. Copies get a writable
+  # backend of the given `kind`.
+
+  def __init__(self, offsets, indices, kind='auto'):
+    self.num_nodes = len(offsets) - 1
+    self.offsets = offsets
+    self.indices = indices
+    self.kind = kind
+
+  def row(self, a):
+    return self.indices[self.offsets[a]:self.offsets[a + 1]]
+
+  def neighbors(self, a):
+    return self.row(a).tolist()
+
+  def degree(self, a):
+    return self.offsets[a + 1] - self.offsets[a]
+
+  def has_edge(self, a, b):
+    row = self.row(a)
+    i = bisect_left(row, b)
+    return i < len(row) and row[i] == b
+
+  def copy(self):
+    # One read of the mapped indices, then every row is a slice of it
+    offsets = self.offsets.tolist()
+    indices = array('i')
+    indices.frombytes(self.indices.cast('B'))
+    rows = [indices[offsets[a]:offsets[a + 1]] if offsets[a + 1] > offsets[a] else None
+            for a in range(self.num_nodes)]
+
+    other = make_adjacency(self.num_nodes, self.kind)
+    if isinstance(other, SparseAdjacency):
+      other.rows = rows
+    else:
+      other.rows = [to_mask(row) if row else 0 for row in rows]
+    return other
+
+  def _read_only(self, *args):
+    # TypeError, as for writes to the mapped VOP buffer
+    raise TypeError("Checkpoint adjacency is read-only, fork the state to modify it")
+
+  add_edge = remove_edge = toggle_edge = set_row = complement = toggle_bipartite = _read_only
+
+  def edges(self):
+    for a in range(self.num_nodes):
+      row = self.row(a)
+      for b in row[bisect_left(row, a):]:
+        yield a, b
+
+  def csr(self):
+    # Zero-copy, read-only views of the mapping
+    import numpy as np
+    return np.frombuffer(self.offsets, dtype=np.int64), np.frombuffer(self.indices, dtype=np.int32)
+
+  def nbytes(self):
+    # Mapped pages belong to the page cache, not to this process
+    return sys.getsizeof(self.offsets) + sys.getsizeof(self.indices)
+
+
+def bits(mask):
+  while mask:
+    low = mask & -mask
+    yield low.bit_length() - 1
+    mask ^= low
+
+
+def csr_arrays(rows):
+  # NumPy `(offsets, indices)` of a list of sorted `int32` rows, where
+  # `None` stands for an empty row
+  import numpy as np
+  offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+  np.cumsum([len(row) if row else 0 for row in rows], out=offsets[1:])
+  indices = array('i')
+  for row in rows:
+    if row:
+      indices.extend(row)
+  return offsets, np.frombuffer(indices, dtype=np.int32)
+
+
+def to_mask(vertices):
+  mask = 0
+  for v in vertices:
+    mask |= 1 << v
+  return mask
+
+
+# Graphs up to this many vertices default to the bitset backend
+BITSET_THRESHOLD = 1024
+
+def make_adjacency(num_nodes, kind='auto'):
+  if kind == 'auto':
+    kind = 'bitset' if num_nodes <= BITSET_THRESHOLD else 'sparse'
+
+  if kind == 'sparse':
+    return SparseAdjacency(num_nodes)
+  elif kind == 'bitset':
+    return BitsetAdjacency(num_nodes)
+
+  raise ValueError("Unknown adjacency backend '{}'".format(kind))
@@ -0,0 +1,71 @@
+import os
+import struct
+from array import array
+
+########################################################
+# Checkpoint format
+#
+# A little-endian file of four sections, each starting on
+# an 8-byte boundary:
+#
+#   header   magic, version, n, number of indices (2|E|)
+#   vops     n x uint8
+#   offsets  (n + 1) x int64
+#   indices  2|E| x int32, the sorted neighbours of each
+#            vertex, vertex a owning offsets[a]:offsets[a+1]
+#
+# so every section can be mapped with `numpy.memmap` and
+# used without parsing.
+########################################################
+
+MAGIC = b'GRAPHST\x00'
+VERSION = 1
+HEADER = struct.Struct('<8sQQQ')
+
+def align(offset):
+  return (offset + 7) & ~7
+
+def layout(num_nodes, num_indices):
+  # Byte offsets of the vops, offsets and indices sections and of the end
+  vops = HEADER.size
+  offsets = align(vops + num_nodes)
+  indices = offsets + 8 * (num_nodes + 1)
+  return vops, offsets, indices, indices + 4 * num_indices
+
+def save(graph_state, path):
+  adjacency = graph_state.adjacency
+  num_nodes = graph_state.num_nodes
+
+  offsets = array('q', [0])
+  for a in range(num_nodes):
+    offsets.append(offsets[-1] + adjacency.degree(a))
+  vops, start, _, _ = layout(num_nodes, offsets[-1])
+
+  # Written next to `path` and renamed over it, so an interrupted save
+  # never leaves a truncated checkpoint behind
+  partial = '{}.partial'.format(path)
+  with open(partial, 'wb') as f:
+    f.write(HEADER.pack(MAGIC, VERSION, num_nodes, offsets[-1]))
+    f.write(graph_state._vop)
+    f.write(bytes(start - vops - num_nodes))
+    f.write(offsets)
+    for a in range(num_nodes):
+      f.write(adjacency.row(a))
+  os.replace(partial, path)
+
+def load(path):
+  # Returns read-only memoryviews of the vops, offsets and indices
+  import numpy as np
+
+  with open(path, 'rb') as f:
+    header = f.read(HEADER.size)
+  if len(header) < HEADER.size or header[:8] != MAGIC:
+    raise ValueError("{} is not a graph state checkpoint".format(path))
+
+  _, version, num_nodes, num_indices = HEADER.unpack(header)
+  if version != VERSION:
+    raise ValueError("Unsupported checkpoint version {}".format(version))
+
+  vops, offsets, indices, end = layout(num_nodes, num_indices)
+  data = memoryview(np.memmap(path, dtype=np.uint8, mode='r', shape=(end,)))
+  return data[vops:vops + num_nodes], data[offsets:indices].cast('q'), data[indices:end].cast('i')
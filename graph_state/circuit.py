@@ -0,0 +1,84 @@
+from array import array
+
+########################################################
+# Opcodes
+#
+# A circuit is an `(m, 3)` integer array, one row per
+# operation: `[opcode, a, b]`.
+#
+#   APPLY    a = target,  b = VOP code
+#   CZ       a = control, b = target
+#   MEASURE  a = target,  b = basis (1 = X, 2 = Y, 3 = Z)
+########################################################
+
+APPLY = 0
+CZ = 1
+MEASURE = 2
+
+BASES = {'X': 1, 'Y': 2, 'Z': 3}
+BASIS_NAMES = {1: 'X', 2: 'Y', 3: 'Z'}
+
+class Circuit(object):
+  def __init__(self):
+    self.ops = array('i')
+
+  def __len__(self):
+    return len(self.ops) // 3
+
+  def append(self, opcode, a, b=0):
+    self.ops.extend((opcode, a, b))
+
+  def apply(self, vop, target):
+    self.append(APPLY, target, vop)
+
+  def h(self, target):
+    self.apply(10, target)
+
+  def x(self, target):
+    self.apply(1, target)
+
+  def y(self, target):
+    self.apply(2, target)
+
+  def z(self, target):
+    self.apply(3, target)
+
+  def s(self, target):
+    self.apply(6, target)
+
+  def s_dagger(self, target):
+    self.apply(5, target)
+
+  def cz(self, control, target):
+    self.append(CZ, control, target)
+
+  def cx(self, control, target):
+    self.h(target)
+    self.cz(control, target)
+    self.h(target)
+
+  def measure(self, target, basis='Z'):
+    self.append(MEASURE, target, BASES.get(basis, 3))
+
+  @classmethod
+  def from_array(cls, ops):
+    import numpy as np
+    circuit = cls()
+    circuit.ops.frombytes(np.ascontiguousarray(ops, dtype=np.int32).tobytes())
+    return circuit
+
+  def to_array(self):
+    import numpy as np
+    return np.array(self.ops, dtype=np.int32).reshape(-1, 3)
+
+
+def as_operations(circuit):
+  # Yields `(opcode, a, b)` triples as plain Python ints
+  if isinstance(circuit, Circuit):
+    ops = circuit.ops
+  else:
+    import numpy as np
+    ops = np.asarray(circuit).reshape(-1).tolist()
+
+  it = iter(ops)
+  return zip(it, it, it)
@@ -0,0 +1,235 @@
+import itertools as it
+import re
+from array import array
+
+from .circuit import APPLY, CZ, MEASURE, Circuit
+
+########################################################
+# Text circuits
+#
+# One instruction per line, a gate name followed by its
+# targets, in the style of Stim:
+#
+#   H 0 1 2        single-qubit gates on every target
+#   CZ 0 1 2 3     two-qubit gates on each pair
+#   M 5            measurements (M or MZ, MX, MY)
+#   # comment      ignored, as are blank lines and TICK
+########################################################
+
+# Single-target instructions as `(opcode, b)`, where `b` is a VOP code or a basis
+SINGLE = {'I': (APPLY, 0), 'X': (APPLY, 1), 'Y': (APPLY, 2), 'Z': (APPLY, 3),
+          'S_DAG': (APPLY, 5), 'SQRT_Z_DAG': (APPLY, 5), 'S': (APPLY, 6), 'SQRT_Z': (APPLY, 6),
+          'H': (APPLY, 10), 'M': (MEASURE, 3), 'MZ': (MEASURE, 3), 'MX': (MEASURE, 1), 'MY': (MEASURE, 2)}
+PAIRS = {'CZ': 1, 'CX': 2, 'CNOT': 2}
+IGNORED = {'TICK'}
+
+# Targets are stored as int32
+MAX_TARGET = 2 ** 31 - 1
+
+# Names that fit in 8 bytes by their little-endian integer value, sorted
+PACKED_NAMES = sorted((int.from_bytes(name.encode(), 'little'), name)
+                      for name in it.chain(SINGLE, PAIRS, IGNORED) if len(name) <= 8)
+
+COMMENT = re.compile('#[^\n]*')
+
+# The ASCII bytes `str.split` takes for whitespace
+SPACES = bytes(c for c in range(128) if chr(c).isspace())
+
+def read_circuit(source, chunk_size=1 << 16):
+  # Yields the circuit in `source`, a path or an open text file, as
+  # one `Circuit` per `chunk_size` lines
+  if isinstance(source, str):
+    with open(source) as f:
+      yield from read_circuit(f, chunk_size)
+    return
+
+  first = 1
+  while True:
+    lines = list(it.islice(source, chunk_size))
+    if not lines:
+      return
+
+    try:
+      ops = parse_chunk(lines)
+    except ValueError:
+      # Anything unusual takes the slow path, which also names the line at fault
+      ops = array('i')
+      for number, line in enumerate(lines, first):
+        try:
+          parse_line(line, ops)
+        except ValueError as e:
+          raise ValueError("Line {}: {}".format(number, e)) from None
+
+    yield Circuit.from_array(ops)
+    first += len(lines)
+
+def parse_chunk(lines):
+  # Parses a list of lines at once into an `(m, 3)` array of operations,
+  # raising ValueError on anything unexpected. Tokens are found on the raw
+  # bytes; the first token of a line names its instruction and every
+  # other token must be a target.
+  import numpy as np
+
+  text = ''.join(lines)
+  if '#' in text:
+    text = COMMENT.sub('', text)
+  data = np.frombuffer(text.upper().encode(), dtype=np.uint8)
+
+  space = np.zeros(256, dtype=bool)
+  space[list(SPACES)] = True
+  filled = np.zeros(len(data) + 2, dtype=bool)
+  filled[1:-1] = ~space[data]
+  bounds = np.flatnonzero(filled[1:] != filled[:-1])
+  starts, ends = bounds[0::2], bounds[1::2]
+  if len(starts) == 0:
+    return np.zeros((0, 3), dtype=np.int32)
+
+  digit = (data >= 48) & (data <= 57)
+  is_target = digit[starts]
+
+  # Every line must start with a name and hold no other, or tokens would
+  # run on into the instruction of the line before
+  line = np.searchsorted(np.flatnonzero(data == 10), starts)
+  first = np.ones(len(starts), dtype=bool)
+  first[1:] = line[1:] != line[:-1]
+  if (is_target == first).any():
+    raise ValueError("Instruction not on a line of its own")
+
+  # Targets are read one digit column at a time
+  target_starts = starts[is_target]
+  lengths = ends[is_target] - target_starts
+  if lengths.max(initial=0) > 9:
+    raise ValueError("Invalid target")
+  targets = np.zeros(len(target_starts), dtype=np.int64)
+  for k in range(lengths.max(initial=0)):
+    more = lengths > k
+    chars = np.minimum(target_starts + k, len(data) - 1)
+    if not (digit[chars] | ~more).all():
+      raise ValueError("Invalid target")
+    targets = np.where(more, 10 * targets + data[chars] - 48, targets)
+
+  # Names of up to 8 bytes are packed into one integer key each and looked
+  # up among the known names; anything else is left to `parse_line`
+  name_starts = starts[~is_target]
+  widths = ends[~is_target] - name_starts
+  if widths.max() > 8:
+    raise ValueError("Long gate name")
+  keys = np.zeros(len(name_starts), dtype=np.uint64)
+  for k in range(widths.max()):
+    chars = data[np.minimum(name_starts + k, len(data) - 1)].astype(np.uint64)
+    keys |= np.where(widths > k, chars, 0).astype(np.uint64) << np.uint64(8 * k)
+
+  known = np.array([key for key, _ in PACKED_NAMES], dtype=np.uint64)
+  instruction_name = np.minimum(np.searchsorted(known, keys), len(known) - 1)
+  if (known[instruction_name] != keys).any():
+    raise ValueError("Unknown gate")
+
+  # Per known name: opcode, argument and pair kind (1 = CZ, 2 = CX)
+  names = [name for _, name in PACKED_NAMES]
+  opcode = np.array([SINGLE.get(name, (0, 0))[0] for name in names], dtype=np.int32)
+  argument = np.array([SINGLE.get(name, (0, 0))[1] for name in names], dtype=np.int32)
+  pair = np.array([PAIRS.get(name, 0) for name in names], dtype=np.int32)
+  single = np.array([name in SINGLE for name in names])
+
+  counts = np.diff(np.append(np.flatnonzero(~is_target), len(starts))) - 1
+  if ((pair[instruction_name] > 0) & (counts & 1 == 1)).any():
+    raise ValueError("Odd number of targets for a two-qubit gate")
+
+  # Per target: its instruction's name, and whether it ends a pair
+  name = np.repeat(instruction_name, counts)
+  position = np.arange(len(targets)) - np.repeat(np.cumsum(counts) - counts, counts)
+  second = (position & 1) == 1
+  is_single = single[name]
+  is_cz = (pair[name] == 1) & second
+  is_cx = (pair[name] == 2) & second
+  if (targets[1:] == targets[:-1])[(is_cz | is_cx)[1:]].any():
+    raise ValueError("Two-qubit gate on a single qubit")
+
+  # Single-target gates and CZs emit one operation, a CX emits H CZ H
+  rows = is_single + is_cz + 3 * is_cx
+  offset = np.cumsum(rows) - rows
+  ops = np.empty((rows.sum(), 3), dtype=np.int32)
+
+  o = offset[is_single]
+  ops[o, 0] = opcode[name[is_single]]
+  ops[o, 1] = targets[is_single]
+  ops[o, 2] = argument[name[is_single]]
+
+  for mask, first in ((is_cz, 0), (is_cx, 1)):
+    j = np.flatnonzero(mask)
+    o = offset[j] + first
+    ops[o] = np.column_stack([np.full(len(j), CZ), targets[j - 1], targets[j]])
+    if first:
+      ops[o - 1] = ops[o + 1] = np.column_stack([np.full(len(j), APPLY), targets[j], np.full(len(j), 10)])
+
+  return ops
+
+def parse_line(line, ops):
+  # Appends the `(opcode, a, b)` triples of one line to `ops`. Slow, but
+  # takes any name and reports exactly what is wrong with the line.
+  if '#' in line:
+    line = line[:line.index('#')]
+  parts = line.split()
+  if not parts:
+    return
+
+  name = parts[0].upper()
+  for t in parts[1:]:
+    if not t.isdigit():
+      raise ValueError("Invalid target '{}'".format(t))
+  targets = [int(t) for t in parts[1:]]
+  for t in targets:
+    if t > MAX_TARGET:
+      raise ValueError("Target {} out of range".format(t))
+
+  if name in SINGLE:
+    opcode, b = SINGLE[name]
+    for t in targets:
+      ops.extend((opcode, t, b))
+  elif name in PAIRS:
+    if len(targets) % 2:
+      raise ValueError("{} needs an even number of targets".format(name))
+    pairs = iter(targets)
+    for a, b in zip(pairs, pairs):
+      if a == b:
+        raise ValueError("{} {} {} acts on a single qubit".format(name, a, b))
+      if PAIRS[name] == 1:
+        ops.extend((CZ, a, b))
+      else:
+        ops.extend((APPLY, b, 10, CZ, a, b, APPLY, b, 10))
+  elif name not in IGNORED:
+    raise ValueError("Unknown gate '{}'".format(parts[0]))
+
+def run_file(graph_state, source, output=None, chunk_size=1 << 16):
+  # Runs the circuit in `source` on `graph_state` one chunk at a time.
+  # Measurement results are written to the file `output`, packed 8 to a
+  # byte with the first result in the lowest bit. Returns the number of
+  # measurements.
+  import numpy as np
+
+  count = 0
+  carry = np.zeros(0, dtype=np.uint8)
+  f = open(output, 'wb') if output is not None else None
+  try:
+    for circuit in read_circuit(source, chunk_size):
+      results = graph_state.run(circuit)
+      count += len(results)
+      if f is not None:
+        bits = np.concatenate([carry, results])
+        full = len(bits) - len(bits) % 8
+        f.write(np.packbits(bits[:full], bitorder='little').tobytes())
+        carry = bits[full:]
+
+    if f is not None and len(carry):
+      f.write(np.packbits(carry, bitorder='little').tobytes())
+  finally:
+    if f is not None:
+      f.close()
+
+  return count
+
+def read_measurements(path, count=None):
+  # The results written by `run_file`, one uint8 per measurement
+  import numpy as np
+  bits = np.unpackbits(np.fromfile(path, dtype=np.uint8), bitorder='little')
+  return bits if count is None else bits[:count]
@@ -0,0 +1,120 @@
+from array import array
+
+########################################################
+# Connected components
+#
+# Qubits in different components of the graph are in a
+# tensor product, so each component can be simulated on
+# its own. Components are tracked incrementally: an added
+# edge joins two of them on the spot, relabelling the
+# smaller. Removing edges and measuring can only split a
+# component, which is marked dirty and searched again the
+# next time it is asked for.
+########################################################
+
+class Components(object):
+  def __init__(self, adjacency):
+    self.adjacency = adjacency
+
+    # Every vertex is labelled with a vertex of its component, the root.
+    # Components of two or more vertices list their members by root.
+    self.label = array('i', range(adjacency.num_nodes))
+    self.members = {}
+    self.dirty = set()
+
+    self.search([a for a in range(adjacency.num_nodes) if adjacency.degree(a)])
+
+  def search(self, vertices):
+    # Relabels `vertices`, a union of whole components
+    label = self.label
+    done = set()
+    for root in vertices:
+      if root in done:
+        continue
+      component = search(self.adjacency, root)
+      done.update(component)
+      for a in component:
+        label[a] = root
+      if len(component) > 1:
+        self.members[root] = component
+
+  def clean(self, root):
+    self.dirty.discard(root)
+    self.search(self.members.pop(root))
+
+  def join(self, a, b):
+    # `a` and `b` were joined by an edge
+    label = self.label
+    root_a, root_b = label[a], label[b]
+    if root_a == root_b:
+      return
+
+    group_a = self.members.pop(root_a, None) or [a]
+    group_b = self.members.pop(root_b, None) or [b]
+    if len(group_a) < len(group_b):
+      root_a, root_b, group_a, group_b = root_b, root_a, group_b, group_a
+
+    for v in group_b:
+      label[v] = root_a
+    group_a.extend(group_b)
+    self.members[root_a] = group_a
+
+    if root_b in self.dirty:
+      self.dirty.discard(root_b)
+      self.dirty.add(root_a)
+
+  def touch(self, a):
+    # The component of `a` may have split
+    root = self.label[a]
+    if root in self.members:
+      self.dirty.add(root)
+
+  def reset(self, vertices):
+    # The edges of `vertices`, a union of whole components, were replaced
+    label = self.label
+    for a in vertices:
+      self.dirty.discard(label[a])
+      self.members.pop(label[a], None)
+
+    root = vertices[0]
+    for a in vertices:
+      label[a] = root
+    if len(vertices) > 1:
+      self.members[root] = list(vertices)
+      self.dirty.add(root)
+
+  def component(self, a, limit=None):
+    root = self.label[a]
+    if root in self.dirty:
+      self.clean(root)
+      root = self.label[a]
+    members = self.members.get(root, [a])
+    if limit is not None and len(members) > limit:
+      return None
+    return sorted(members)
+
+  def all(self):
+    for root in list(self.dirty):
+      self.clean(root)
+
+    label, members = self.label, self.members
+    components = [sorted(members[a]) if a in members else [a]
+                  for a in range(len(label)) if label[a] == a]
+    components.sort()
+    return components
+
+
+def search(adjacency, start, limit=None):
+  # The component of `start` in breadth-first order, or None as soon as it
+  # is found to have more than `limit` vertices
+  row = adjacency.row
+  seen = {start}
+  component = [start]
+  for a in component:
+    for b in row(a):
+      if b not in seen:
+        seen.add(b)
+        component.append(b)
+    if limit is not None and len(component) > limit:
+      return None
+  return component
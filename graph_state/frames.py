@@ -0,0 +1,205 @@
+import numpy as np
+
+from .circuit import APPLY, CZ, MEASURE, Circuit, as_operations
+from .graph_state import GraphState, seeded_rng
+from .lookup_tables import measure_lookup
+
+########################################################
+# Pauli frame simulation
+#
+# A noiseless reference run of the circuit on a GraphState
+# fixes one valid outcome for every measurement. Each shot
+# then only tracks the Pauli error separating it from the
+# reference, as an X and a Z bit per qubit, and flips the
+# reference outcomes its error anticommutes with. The bits
+# are packed 64 shots to a uint64 word, so a gate costs a
+# few NumPy operations across all shots.
+#
+# Outcomes that are random in the reference come out random
+# in every shot because each qubit's frame gets a random
+# copy of a Pauli that stabilizes it: Z at the start and
+# the measured Pauli after every measurement (as in Stim,
+# see https://arxiv.org/abs/2103.02202).
+########################################################
+
+# The (x, z) bits of the Pauli bases 1 = X, 2 = Y, 3 = Z
+PAULI_BITS = {1: (1, 0), 2: (1, 1), 3: (0, 1)}
+
+# Where each VOP C sends an error: the (x, z) bits of C X C^dagger and C Z C^dagger
+FRAME_MAPS = [(PAULI_BITS[measure_lookup[1][vop][0]], PAULI_BITS[measure_lookup[3][vop][0]])
+              for vop in range(24)]
+IDENTITY_MAP = ((1, 0), (0, 1))
+
+class PauliFrames(object):
+  def __init__(self, num_qubits, shots, rng=None):
+
+    self.num_qubits = num_qubits
+    self.shots = shots
+    self.words = (shots + 63) // 64
+    self.rng = np.random.default_rng(rng)
+
+    # Every qubit starts in |0>, where a Z error is harmless
+    self.x = np.zeros((num_qubits, self.words), dtype=np.uint64)
+    self.z = self.random_words(num_qubits)
+
+  ########################################################
+  # Random bits
+  ########################################################
+
+  def random_words(self, rows):
+    # `(rows, words)` uniformly random bits
+    return np.frombuffer(self.rng.bytes(8 * rows * self.words), dtype=np.uint64).reshape(rows, self.words).copy()
+
+  def events(self, p, rows):
+    # The `(row, shot)` pairs at which an event of probability `p` happens,
+    # drawn as geometric gaps so that rare events cost little
+
+    size = rows * self.shots
+    if p <= 0 or size == 0:
+      positions = np.zeros(0, dtype=np.int64)
+    elif p >= 1:
+      positions = np.arange(size)
+    else:
+      chunks = []
+      last = -1
+      while last < size:
+        expected = p * (size - last)
+        gaps = self.rng.geometric(p, size=int(expected + 4 * expected ** 0.5) + 16)
+        chunk = last + np.cumsum(gaps)
+        chunks.append(chunk[chunk < size])
+        last = chunk[-1]
+      positions = np.concatenate(chunks)
+
+    return np.divmod(positions, self.shots)
+
+  def toggle(self, frame, rows, shots):
+    # Flip the bits of `shots` in the `rows` of `frame`
+    np.bitwise_xor.at(frame, (rows, shots >> 6), np.left_shift(np.uint64(1), (shots & 63).astype(np.uint64)))
+
+  ########################################################
+  # Gates and measurements
+  ########################################################
+
+  def apply(self, vop, target):
+    if FRAME_MAPS[vop] == IDENTITY_MAP:
+      return
+
+    (xx, xz), (zx, zz) = FRAME_MAPS[vop]
+
+    x, z = self.x[target].copy(), self.z[target].copy()
+    self.x[target] = (x if xx else 0) ^ (z if zx else 0)
+    self.z[target] = (x if xz else 0) ^ (z if zz else 0)
+
+  def cz(self, control, target):
+    self.z[control] ^= self.x[target]
+    self.z[target] ^= self.x[control]
+
+  def measure(self, target, basis=3):
+    # The packed shots whose error flips a measurement of `target` in
+    # `basis` (1 = X, 2 = Y, 3 = Z), which afterwards stabilizes the qubit
+    x, z = self.x[target], self.z[target]
+    r = self.random_words(1)[0]
+    if basis == 1:
+      flips = z.copy()
+      x ^= r
+    elif basis == 2:
+      flips = x ^ z
+      x ^= r
+      z ^= r
+    else:
+      flips = x.copy()
+      z ^= r
+    return flips
+
+  ########################################################
+  # Noise channels
+  ########################################################
+
+  def x_error(self, targets, p):
+    rows, shots = self.events(p, len(targets))
+    self.toggle(self.x, np.take(targets, rows), shots)
+
+  def depolarize(self, targets, p):
+    # X, Y or Z, each with probability p / 3
+    rows, shots = self.events(p, len(targets))
+    qubits = np.take(targets, rows)
+    pauli = self.rng.integers(1, 4, size=len(rows))
+    has_x, has_z = pauli != 3, pauli != 1
+    self.toggle(self.x, qubits[has_x], shots[has_x])
+    self.toggle(self.z, qubits[has_z], shots[has_z])
+
+  def flip(self, flips, p):
+    # Flip each bit of the packed `flips` with probability p, in place
+    rows, shots = self.events(p, 1)
+    self.toggle(flips[None], rows, shots)
+
+
+class FrameSimulator(object):
+  # Runs a circuit on `shots` noisy shots at once. After every gate each
+  # qubit it acts on suffers a depolarizing error with probability
+  # `depolarize` and an X error with probability `bit_flip`; every
+  # measurement result is flipped with probability `measure_flip`.
+
+  def __init__(self, num_qubits, shots, depolarize=0.0, bit_flip=0.0, measure_flip=0.0, seed=None,
+               adjacency='auto'):
+
+    reference_seed, frame_seed = np.random.SeedSequence(seed).spawn(2)
+    self.reference = GraphState(num_qubits, adjacency, seeded_rng(reference_seed))
+    self.frames = PauliFrames(num_qubits, shots, np.random.default_rng(frame_seed))
+
+    self.shots = shots
+    self.depolarize = depolarize
+    self.bit_flip = bit_flip
+    self.measure_flip = measure_flip
+
+  def noise(self, targets):
+    if self.depolarize:
+      self.frames.depolarize(targets, self.depolarize)
+    if self.bit_flip:
+      self.frames.x_error(targets, self.bit_flip)
+
+  def run(self, circuit, packed=False):
+    # Runs `circuit`, which may be the next chunk of a longer one, on every
+    # shot. Returns a `(shots, m)` bit array of the m measurement results,
+    # or with `packed` an `(m, words)` uint64 array, 64 shots to a word.
+
+    frames = self.frames
+    reference = self.reference.run(circuit)
+    records = []
+
+    for opcode, a, b in as_operations(circuit):
+      if opcode == APPLY:
+        frames.apply(b, a)
+        self.noise([a])
+      elif opcode == CZ:
+        frames.cz(a, b)
+        self.noise([a, b])
+      elif opcode == MEASURE:
+        flips = frames.measure(a, b)
+        if self.measure_flip:
+          frames.flip(flips, self.measure_flip)
+        records.append(flips)
+      else:
+        raise ValueError("Unknown opcode {}".format(opcode))
+
+    if not len(reference):
+      return np.zeros((0, frames.words), dtype=np.uint64) if packed else np.zeros((self.shots, 0), dtype=np.uint8)
+
+    records = np.array(records, dtype=np.uint64).reshape(len(reference), frames.words)
+    records ^= np.where(reference == 1, ~np.uint64(0), np.uint64(0))[:, None]
+    if packed:
+      return records
+
+    # Transposing bytes before unpacking moves 8 times less data than
+    # transposing the unpacked bits
+    columns = np.ascontiguousarray(records.view(np.uint8).T)
+    bits = np.unpackbits(columns[:, :, None], axis=2, bitorder='little')
+    return np.ascontiguousarray(bits.transpose(0, 2, 1)).reshape(-1, len(reference))[:self.shots]
+
+
+def run_noisy_shots(num_qubits, circuit, shots, depolarize=0.0, bit_flip=0.0, measure_flip=0.0, seed=None):
+  # Like `run_shots`, with noise, for all shots in one pass
+  if not isinstance(circuit, Circuit):
+    circuit = Circuit.from_array(circuit)
+  simulator = FrameSimulator(num_qubits, shots, depolarize, bit_flip, measure_flip, seed)
+  return simulator.run(circuit)
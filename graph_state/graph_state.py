@@ -1,32 +1,72 @@
 import itertools as it
+import numbers
 import random
+import sys
 
-from .qubit_vertex import QubitVertex
-from .lookup_tables import measure_table, decomposition_table, conjugation_table, cz_table
+from . import checkpoint
+from .adjacency import CSRAdjacency, csr_arrays, make_adjacency
+from .components import Components, search
+from .stats import Stats, instrument, uninstrument
+from .circuit import APPLY, CZ, MEASURE, BASES, BASIS_NAMES, as_operations
+from .lookup_tables import measure_lookup, decomposition_table, conjugation_lookup, cz_lookup, multiplication_lookup
+
+# VOPs that commute with CZ: I, Z, S^dagger and S
+Z_DIAGONAL = frozenset([0, 3, 5, 6])
+
+def powers(vop):
+  result = [0]
+  for _ in range(3):
+    result.append(multiplication_lookup[result[-1]][vop])
+  return result
+
+# VOP factors of 1, 2 and 3 consecutive local complementations
+LC_VERTEX_VOP = powers(14)
+LC_NEIGHBOR_VOP = powers(6)
+
+# `sample` cuts out components up to this size, and samples larger ones
+# on the whole state, where they would cost about as much to find
+SAMPLE_COMPONENT_LIMIT = 1024
 
 class GraphState(object):
-  def __init__(self, num_nodes):
-    self.vertices = []
+  def __init__(self, num_nodes, adjacency='auto', rng=None):
+    self.num_nodes = num_nodes
+    self.rng = make_rng(rng)
+
+    # One byte per qubit, every qubit starts in |0> = H|+>
+    self._vop = bytearray([10]) * num_nodes
+
+    self.adjacency = make_adjacency(num_nodes, adjacency)
+    self._components = None
+    self.stats = None
+
+  def __len__(self):
+    return self.num_nodes
+
+  @property
+  def vops(self):
+    # Zero-copy NumPy view of the VOP buffer
+    import numpy as np
+    return np.frombuffer(self._vop, dtype=np.uint8)
 
-    for i in range(num_nodes):
-      self.vertices.append(QubitVertex())
-  
   ########################################################
   # Simulation Methods
   ########################################################
 
   def apply(self, vop, target):
-    self.vertices[target].apply(vop)
+    self._vop[target] = multiplication_lookup[vop][self._vop[target]]
+
+  def apply_opposite(self, vop, target):
+    self._vop[target] = multiplication_lookup[self._vop[target]][vop]
 
   def h(self, target):
     self.apply(10, target)
 
   def x(self, target):
     self.apply(1, target)
-  
+
   def y(self, target):
     self.apply(2, target)
-  
+
   def z(self, target):
     self.apply(3, target)
 
@@ -40,38 +80,37 @@ class GraphState(object):
     self.apply(5, target)
 
   def cz(self, control, target):
-    if self.vertices[control].is_isolated(target):
+    vop = self._vop
+
+    # CZ commutes with Z-diagonal VOPs, so only the others need reducing,
+    # and a vertex without other neighbours is handled by the table
+    if vop[control] not in Z_DIAGONAL and self.has_other_neighbors(control, target):
       self.reduce_vop(control, target)
 
-    if self.vertices[target].is_isolated(control):
+    if vop[target] not in Z_DIAGONAL and self.has_other_neighbors(target, control):
       self.reduce_vop(target, control)
 
-    if self.vertices[control].is_isolated(target): 
+    if vop[control] not in Z_DIAGONAL and self.has_other_neighbors(control, target):
       self.reduce_vop(control, target)
 
     has_edge = self.has_edge(control, target)
-    control_vop = self.vertices[control].vop_code
-    target_vop = self.vertices[target].vop_code
-    
-    edge, control_vop, target_vop = cz_table[int(has_edge), control_vop, target_vop]
-    self.vertices[control].set_vop(control_vop)
-    self.vertices[target].set_vop(target_vop)
+    control_vop = vop[control]
+    target_vop = vop[target]
+
+    edge, control_vop, target_vop = cz_lookup[has_edge][control_vop][target_vop]
+    vop[control] = control_vop
+    vop[target] = target_vop
     if has_edge != edge:
       self.toggle_edge(control, target)
 
-  def measure(self, target, basis='Z'):
-    if basis == 'X':
-      basis = 1
-    elif basis == 'Y':
-      basis = 2
-    else:
-      basis = 3
-
-    vop_conjugate = conjugation_table[self.vertices[target].vop_code]
-    bare_basis, phase = measure_table[basis, vop_conjugate]
+  def measure(self, target, basis='Z', force=None):
+    bare_basis, phase = self.bare_basis(target, basis)
 
-    # Choose a result
-    choice = random.choice([0, 1])
+    # Choose a result, or take the forced one if the outcome is random
+    if force is None:
+      choice = random_bit(self.rng)
+    else:
+      choice = force ^ int(phase == -1)
 
     if bare_basis == 1:
       choice = self.bare_measure_x(target, choice)
@@ -79,11 +118,14 @@ class GraphState(object):
       choice = self.bare_measure_y(target, choice)
     else:
       choice = self.bare_measure_z(target, choice)
-    
+
     # Flip the result if there is a negative phase
     if phase == -1:
       choice = not choice
-    
+
+    if self._components is not None:
+      self._components.touch(target)
+
     return int(choice)
 
   def cx(self, control, target):
@@ -91,152 +133,502 @@ class GraphState(object):
     self.cz(control, target)
     self.h(target)
 
+  def bare_basis(self, target, basis):
+    # The Pauli that `basis` becomes when pulled through the VOP of
+    # `target`, and the sign it picks up on the way
+    return measure_lookup[BASES.get(basis, 3)][conjugation_lookup[self._vop[target]]]
+
+  def is_deterministic(self, target, basis='Z'):
+    # Only an X measurement of an isolated vertex of the bare graph
+    # has a fixed outcome
+    return self.bare_basis(target, basis)[0] == 1 and self.degree(target) == 0
+
+  def peek_measure(self, target, basis='Z'):
+    # The outcome `measure` would return, without measuring: 0 or 1 if it
+    # is deterministic, 'random' otherwise. The state is not touched.
+    bare_basis, phase = self.bare_basis(target, basis)
+    if bare_basis == 1 and self.degree(target) == 0:
+      return int(phase == -1)
+    return 'random'
+
+  def peek_measures(self, targets, basis='Z'):
+    # `peek_measure` for many targets at once, as an int8 array with -1
+    # standing for 'random'
+    import numpy as np
+    from . import lookup_tables
+
+    targets = np.asarray(targets, dtype=np.int64)
+    vops = np.frombuffer(self._vop, dtype=np.uint8)[targets]
+    bare_basis, phase = lookup_tables.measure_table[BASES.get(basis, 3), lookup_tables.conjugation_table[vops]].T
+    degrees = np.fromiter((self.degree(t) for t in targets.tolist()), dtype=np.int64, count=len(targets))
+
+    outcomes = np.full(len(targets), -1, dtype=np.int8)
+    deterministic = (bare_basis == 1) & (degrees == 0)
+    outcomes[deterministic] = phase[deterministic] == -1
+    return outcomes
+
+  def expectation(self, pauli):
+    # <P> for a Pauli operator P given as a string with one letter per
+    # qubit and an optional sign ('-XIZ'), or as a dict ({0: 'X', 2: 'Z'}).
+    # The state is an eigenstate of P, with eigenvalue +1 or -1, or <P> = 0.
+    sign, qubits, bases = pauli_terms(pauli)
+
+    # Pull P through the VOPs onto the bare graph state
+    x_part, z_part = set(), set()
+    for q, basis in zip(qubits, bases):
+      bare_basis, phase = measure_lookup[basis][conjugation_lookup[self._vop[q]]]
+      sign *= phase
+      if bare_basis != 3:
+        x_part.add(q)
+      if bare_basis != 1:
+        z_part.add(q)
+
+    # The stabilizers of the graph state are the products over a set S of
+    # K_a = X_a Z_N(a), that is (-1)^|E(S)| X_S Z_N(S), where N(S) holds
+    # the vertices with an odd number of neighbours in S
+    odd = set()
+    inner = 0
+    for a in x_part:
+      ngbh = self.neighbors(a)
+      odd.symmetric_difference_update(ngbh)
+      inner += len(x_part.intersection(ngbh))
+    if odd != z_part:
+      return 0
+
+    # Every Y = iXZ on the diagonal contributes a factor -i
+    return sign * (-1) ** ((inner // 2 + len(x_part & z_part) // 2) % 2)
+
+  def expectations(self, paulis):
+    # `expectation` for many Pauli operators in one vectorised pass over
+    # all of their terms. Returns an int8 array of +1, -1 and 0.
+    import numpy as np
+    from . import lookup_tables
+
+    n = self.num_nodes
+    terms = [pauli_terms(pauli) for pauli in paulis]
+    m = len(terms)
+    signs = np.array([sign for sign, _, _ in terms], dtype=np.int64)
+    observable = np.repeat(np.arange(m, dtype=np.int64), [len(qubits) for _, qubits, _ in terms])
+    qubits = np.array([q for _, qs, _ in terms for q in qs], dtype=np.int64)
+    bases = np.array([b for _, _, bs in terms for b in bs], dtype=np.int64)
+
+    vops = np.frombuffer(self._vop, dtype=np.uint8)[qubits]
+    bare_basis, phase = lookup_tables.measure_table[bases, lookup_tables.conjugation_table[vops]].T
+    x = bare_basis != 3
+    z = bare_basis != 1
+
+    # Neighbours of the X part of each observable, keyed `observable * n + vertex`
+    sources, source_observable = qubits[x], observable[x]
+    offsets, indices = csr_arrays([self.adjacency.row(a) for a in sources.tolist()])
+    neighbours = np.repeat(source_observable, np.diff(offsets)) * n + indices
+
+    keys, counts = np.unique(neighbours, return_counts=True)
+    odd = keys[counts % 2 == 1]
+    z_keys = np.sort(observable[z] * n + qubits[z])
+    eigenstate = np.ones(m, dtype=bool)
+    eigenstate[np.setxor1d(odd, z_keys, assume_unique=True) // n] = False
+
+    inner = np.bincount(neighbours[np.isin(neighbours, source_observable * n + sources)] // n, minlength=m)
+    ys = np.bincount(observable[x & z], minlength=m)
+    negative = np.bincount(observable[phase == -1], minlength=m)
+
+    values = signs * (1 - 2 * ((inner // 2 + ys // 2 + negative) % 2))
+    return np.where(eigenstate, values, 0).astype(np.int8)
+
+  def run(self, circuit):
+    # Runs of single-qubit Cliffords are folded into one pending VOP per
+    # qubit, which is only applied when a CZ or a measurement reaches it.
+    # Only qubits with a pending VOP are kept, so a call costs nothing per
+    # qubit of the state.
+    mult = multiplication_lookup
+    vop = self._vop
+    pending = {}
+    results = []
+    stats = self.stats
+
+    for opcode, a, b in as_operations(circuit):
+      if opcode == APPLY:
+        pending[a] = mult[b][pending.get(a, 0)]
+        if stats is not None:
+          stats.count_gate(b)
+        continue
+
+      if a in pending:
+        vop[a] = mult[pending.pop(a)][vop[a]]
+
+      if opcode == CZ:
+        if b in pending:
+          vop[b] = mult[pending.pop(b)][vop[b]]
+        self.cz(a, b)
+      elif opcode == MEASURE:
+        results.append(self.measure(a, BASIS_NAMES[b]))
+      else:
+        raise ValueError("Unknown opcode {}".format(opcode))
+
+    for a, v in pending.items():
+      vop[a] = mult[v][vop[a]]
+
+    import numpy as np
+    return np.array(results, dtype=np.uint8)
+
+  def sample(self, targets, shots, basis='Z'):
+    # Measures `targets` in order on `shots` copies of this state, which is
+    # left untouched. Returns a `(shots, len(targets))` bit array.
+    import numpy as np
+
+    targets = list(targets)
+    bases = [basis] * len(targets) if isinstance(basis, str) else list(basis)
+    samples = np.zeros((shots, len(targets)), dtype=np.uint8)
+
+    # Outcomes in different components are independent, so every small
+    # component holding targets is sampled on a sub-state of its own
+    columns = {}
+    for column, t in enumerate(targets):
+      columns.setdefault(t, []).append(column)
+
+    factors = []
+    remaining = set(columns)
+    for t in targets:
+      if t in remaining:
+        vertices = self.component(t, SAMPLE_COMPONENT_LIMIT)
+        if vertices is None:
+          return self.sample_factor(targets, bases, samples)
+        held = remaining.intersection(vertices)
+        remaining -= held
+        factors.append((vertices, sorted(c for a in held for c in columns[a])))
+
+    if len(factors) == 1 and len(factors[0][0]) == self.num_nodes:
+      return self.sample_factor(targets, bases, samples)
+
+    for vertices, factor_columns in factors:
+      index = {a: i for i, a in enumerate(vertices)}
+      state = self.substate(vertices)
+      samples[:, factor_columns] = state.sample_factor([index[targets[c]] for c in factor_columns],
+                                                       [bases[c] for c in factor_columns],
+                                                       samples[:, factor_columns])
+    return samples
+
+  def sample_factor(self, targets, bases, samples):
+    # `sample` on a state whose graph is connected, or treated as such,
+    # filling and returning `samples`
+    import numpy as np
+
+    shots = len(samples)
+
+    # Forks of `base` are cheap even when this state is a mapped checkpoint
+    base = self.fork()
+
+    if shots <= len(targets):
+      for shot in range(shots):
+        state = base.fork()
+        samples[shot] = [state.measure(t, b) for t, b in zip(targets, bases)]
+      return samples
+
+    # The outcomes are an affine function x0 ^ (choices @ M) of the random
+    # measurement choices, so a reference pass with every choice forced to 0
+    # plus one pass per random measurement fixes the distribution exactly.
+    # Deterministic measurements show up as all-zero columns of M.
+    state = base
+    reference = []
+    branches = []
+    for step, (t, b) in enumerate(zip(targets, bases)):
+      if not state.is_deterministic(t, b):
+        branches.append((step, state.fork()))
+      reference.append(state.measure(t, b, force=0))
+
+    reference = np.array(reference, dtype=np.uint8)
+    generators = np.zeros((len(branches), len(targets)), dtype=np.uint8)
+    for row, (step, state) in enumerate(branches):
+      outcome = [state.measure(targets[step], bases[step], force=1)]
+      outcome += [state.measure(t, b, force=0) for t, b in zip(targets[step + 1:], bases[step + 1:])]
+      generators[row, step:] = np.array(outcome, dtype=np.uint8) ^ reference[step:]
+
+    samples[:] = reference
+    if len(branches):
+      choices = random_bits(self.rng, shots, len(branches))
+      samples ^= (choices.astype(np.int64) @ generators.astype(np.int64) & 1).astype(np.uint8)
+
+    return samples
+
   ########################################################
   # Computation Algorithms see https://arxiv.org/abs/quant-ph/0504117.pdf)
   ########################################################
 
   def reduce_vop(self, a, b):
-    # First, we choose a swapping partner c
-    external = self.vertices[a].non_isolated(b)
-    c = external.pop() if external else b
-
-    d = decomposition_table[self.vertices[a].vop_code]
-    for factor in reversed(d):
+    # First, we choose a swapping partner c, preferring the neighbour
+    # with the fewest neighbours of its own, as its complementations
+    # toggle the fewest edges
+    external = [n for n in self.neighbors(a) if n != b]
+    c = min(external, key=self.degree) if external else b
+
+    d = decomposition_table[self._vop[a]]
+    for factor, run in it.groupby(reversed(d)):
       if factor == 'X':
         # Factor is sqrt(-iX)
-        self.local_complementation(a)
+        self.local_complementation(a, len(list(run)))
       else:
         # Factor is sqrt(iZ)
-        self.local_complementation(b)
-    
-    # Now the vertex operator of a is `0`, 
+        self.local_complementation(c, len(list(run)))
+
+    # Now the vertex operator of a is `0`,
     # the identity operator.
 
-  def local_complementation(self, a):
-    ngbh = self.vertices[a].neighbors.copy()
+  def local_complementation(self, a, times=1):
+    # Complementing the same vertex `times` times in a row. The graph
+    # only changes for odd `times`, and the VOP factors have order 4.
+    times %= 4
+    if times == 0:
+      return
+
+    ngbh = self.neighbors(a)
+    if times % 2:
+      self.adjacency.complement(ngbh)
 
-    for i, j in it.combinations(ngbh, 2):
-      self.toggle_edge(i, j)
+    self.apply_opposite(LC_VERTEX_VOP[times], a)
+    for i in ngbh:
+      self.apply_opposite(LC_NEIGHBOR_VOP[times], i)
 
-    self.vertices[a].apply_opposite(14)
-    for i in self.vertices[a].neighbors:
-      self.vertices[i].apply_opposite(6)
-  
   def bare_measure_x(self, target, choice):
     # If the vertex is isolated, measurement will
     # always be a zero.
-    ngbh = self.vertices[target].neighbors.copy() 
-    if len(self.vertices[target].neighbors) == 0:
+    ngbh_a = set(self.neighbors(target))
+    if len(ngbh_a) == 0:
       return 0
 
-    b = next(iter(ngbh))
+    b = next(iter(ngbh_a))
+    ngbh_b = set(self.neighbors(b))
 
     if choice == 1:
-      self.vertices[b].apply_opposite(9)
-      self.vertices[target].apply_opposite(3)
-      
-      for n in self.vertices[b].neighbors - self.vertices[target].neighbors - {target}:
-        self.vertices[n].apply_opposite(3)
+      self.apply_opposite(9, b)
+      self.apply_opposite(3, target)
+
+      for n in ngbh_b - ngbh_a - {target}:
+        self.apply_opposite(3, n)
     else:
-      self.vertices[b].apply_opposite(11)
+      self.apply_opposite(11, b)
 
-      for n in self.vertices[target].neighbors - self.vertices[b].neighbors - {b}:
-        self.vertices[n].apply_opposite(3)
+      for n in ngbh_a - ngbh_b - {b}:
+        self.apply_opposite(3, n)
 
-    ngbh_a = self.vertices[target].neighbors
-    ngbh_b = self.vertices[b].neighbors
     self.toggle_edges(ngbh_a, ngbh_b)
-
-    shared_edges = ngbh_a & ngbh_b
-    for i, j in it.combinations(shared_edges, 2):
-      self.toggle_edge(i, j)
+    self.adjacency.complement(ngbh_a & ngbh_b)
 
     for n in ngbh_a - {b}:
       self.toggle_edge(b, n)
-    
+
     return choice
 
+  def bare_measure_y(self, target, choice):
+    ngbh = self.neighbors(target)
+    for n in ngbh:
+      self.apply_opposite(5 if choice else 6, n)
 
+    self.adjacency.complement(ngbh + [target])
 
-  def bare_measure_y(self, target, choice):
-    for n in self.vertices[target].neighbors:
-      self.vertices[target].apply_opposite(5 if choice else 6)
-    
-    for i, j in it.combinations(self.vertices[target].neighbors | {target} , 2):
-      self.toggle_edge(i, j)
-    
-    self.vertices[target].apply_opposite(5 if choice else 6)
+    self.apply_opposite(5 if choice else 6, target)
     return choice
 
   def bare_measure_z(self, target, choice):
-    for n in self.vertices[target].neighbors.copy():
+    for n in self.neighbors(target):
       self.remove_edge(target, n)
       if choice:
-        self.vertices[n].apply_opposite(3)
+        self.apply_opposite(3, n)
 
     if choice:
-      self.vertices[target].apply_opposite(1)
+      self.apply_opposite(1, target)
 
-    self.vertices[target].apply_opposite(10) 
+    self.apply_opposite(10, target)
 
     return choice
-  
+
   ########################################################
   # Graph Methods
   ########################################################
 
+  def neighbors(self, a):
+    return self.adjacency.neighbors(a)
+
+  def degree(self, a):
+    return self.adjacency.degree(a)
+
+  def has_other_neighbors(self, a, b):
+    # ngbh a \ {b} != {}
+    degree = self.adjacency.degree(a)
+    return degree > 1 or (degree == 1 and not self.adjacency.has_edge(a, b))
+
   def toggle_edge(self, a, b):
-    if self.has_edge(a, b):
-      self.remove_edge(a, b)
-    else:
-      self.add_edge(a, b)
+    self.adjacency.toggle_edge(a, b)
+    if self._components is not None:
+      if self.adjacency.has_edge(a, b):
+        self._components.join(a, b)
+      else:
+        self._components.touch(a)
 
   def has_edge(self, a, b):
-    return b in self.vertices[a].neighbors or a in self.vertices[b].neighbors
-  
+    return self.adjacency.has_edge(a, b)
+
   def add_edge(self, a, b):
-    self.vertices[a].neighbors.add(b)
-    self.vertices[b].neighbors.add(a)
+    self.adjacency.add_edge(a, b)
+    if self._components is not None:
+      self._components.join(a, b)
 
   def remove_edge(self, a, b):
-    self.vertices[a].neighbors.remove(b)
-    self.vertices[b].neighbors.remove(a)
+    self.adjacency.remove_edge(a, b)
+    if self._components is not None:
+      self._components.touch(a)
 
   def edges(self):
-    possible_edges = it.combinations(range(len(self.vertices)), 2)
-    return [(a, b) for [a, b] in possible_edges if self.has_edge(a, b)]
+    # Lazily yields every edge once as `(a, b)` with `a < b`, in O(V + E)
+    return self.adjacency.edges()
+
+  def edge_array(self):
+    # All edges at once as an `(m, 2)` int32 array, in the order of `edges`
+    import numpy as np
+    offsets, indices = self.adjacency.csr()
+    sources = np.repeat(np.arange(self.num_nodes, dtype=np.int32), np.diff(offsets))
+    upper = sources < indices
+    return np.column_stack([sources[upper], indices[upper]])
+
+  def to_scipy_sparse(self):
+    # Symmetric adjacency matrix as a `scipy.sparse.csr_matrix`
+    import numpy as np
+    import scipy.sparse
+    offsets, indices = self.adjacency.csr()
+    data = np.ones(len(indices), dtype=np.uint8)
+    return scipy.sparse.csr_matrix((data, indices, offsets), shape=(self.num_nodes, self.num_nodes))
 
   def toggle_edges(self, a, b):
-    done = set()
-    for i, j in it.product(a, b):
-      if i != j and not (i, j) in done:
-        done.add((i, j))
-        done.add((j, i))
-        self.toggle_edge(i, j)
+    self.adjacency.toggle_bipartite(a, b)
 
   ########################################################
-  # Helper Methods (for things such as drawing)
+  # Components
+  #
+  # Local complementation never changes the components of a
+  # graph, so only edges set or cleared one at a time and
+  # measurements need to report to the tracker.
   ########################################################
 
-  def __str__(self):
-    res = ''
+  def components(self):
+    # The connected components as sorted lists of vertices, ordered by
+    # their first vertex. The first call searches the whole graph, after
+    # which the components are tracked as the graph changes.
+    if self._components is None:
+      self._components = Components(self.adjacency)
+    return self._components.all()
+
+  def component(self, a, limit=None):
+    # The sorted vertices of the component of `a`, or None if it has more
+    # than `limit`
+    if self._components is not None:
+      return self._components.component(a, limit)
+    vertices = search(self.adjacency, a, limit)
+    return None if vertices is None else sorted(vertices)
+
+  def substate(self, vertices):
+    # A new state on `vertices`, with qubit i standing for vertices[i]. No
+    # vertex may have neighbours outside of `vertices`.
+    index = {a: i for i, a in enumerate(vertices)}
+    state = self.__class__(len(vertices), rng=self.rng)
+    for i, a in enumerate(vertices):
+      try:
+        row = sorted(index[b] for b in self.adjacency.row(a))
+      except KeyError:
+        raise ValueError("Vertex {} has neighbours outside of the sub-state".format(a)) from None
+      state._vop[i] = self._vop[a]
+      state.adjacency.set_row(i, row)
+    return state
+
+  def split(self, components=None):
+    # `(vertices, substate(vertices))` for each of `components`, by default
+    # `components()`. A component may also be a union of components.
+    if components is None:
+      components = self.components()
+    return [(vertices, self.substate(vertices)) for vertices in components]
+
+  def merge(self, parts):
+    # Writes back `(vertices, state)` pairs such as those of `split`: qubit
+    # i of each state replaces vertices[i], all of whose neighbours here
+    # must be among `vertices`
+    for vertices, state in parts:
+      if len(vertices) != state.num_nodes:
+        raise ValueError("{} vertices for a state of {} qubits".format(len(vertices), state.num_nodes))
+      members = set(vertices)
+      for a in vertices:
+        if not members.issuperset(self.adjacency.row(a)):
+          raise ValueError("Vertex {} has neighbours outside of the merged state".format(a))
+
+      for i, a in enumerate(vertices):
+        self.adjacency.set_row(a, sorted(vertices[j] for j in state.adjacency.row(i)))
+        self._vop[a] = state._vop[i]
+
+      if self._components is not None:
+        self._components.reset(vertices)
+
+  def fork(self):
+    # Copy-on-write copy: the VOP buffer is duplicated, adjacency rows are
+    # shared with this state until one side modifies them. Components are
+    # not tracked on the copy until it is asked for them.
+    other = self.__class__.__new__(self.__class__)
+    other.num_nodes = self.num_nodes
+    other.rng = self.rng
+    other._vop = bytearray(self._vop)
+    other.adjacency = self.adjacency.copy()
+    other._components = None
+    other.stats = None
+    return other
+
+  def save(self, path):
+    # Compact binary checkpoint, see `checkpoint` for the layout
+    checkpoint.save(self, path)
+
+  @classmethod
+  def load(cls, path, adjacency='auto', rng=None):
+    # Maps a checkpoint read-only without parsing it. The loaded state can
+    # be inspected, sampled and forked; forks are writable and use the
+    # `adjacency` backend.
+    vop, offsets, indices = checkpoint.load(path)
+    state = cls.__new__(cls)
+    state.num_nodes = len(vop)
+    state.rng = make_rng(rng)
+    state._vop = vop
+    state.adjacency = CSRAdjacency(offsets, indices, adjacency)
+    state._components = None
+    state.stats = None
+    return state
+
+  def enable_stats(self, callback=None):
+    # Counts gates, local complementations and edge toggles and times the
+    # hot methods of this state until `disable_stats`. Forks are not counted.
+    if self.stats is None:
+      self.stats = Stats()
+      instrument(self, self.stats)
+    if callback is not None:
+      self.stats.add_callback(callback)
+    return self.stats
+
+  def disable_stats(self):
+    if self.stats is not None:
+      uninstrument(self)
+      self.stats = None
+
+  def nbytes(self):
+    # Bytes held by the VOP buffer and the adjacency structure
+    return sys.getsizeof(self._vop) + self.adjacency.nbytes()
 
-    for idx, v in enumerate(self.vertices):
-      res += '[{}]: {}\n'.format(idx, v)
+  ########################################################
+  # Helper Methods (for things such as drawing)
+  ########################################################
 
-    return res
+  def __str__(self):
+    return ''.join('[{}]: {} --> {}\n'.format(idx, vop, set(self.neighbors(idx)))
+                   for idx, vop in enumerate(self._vop))
 
   def to_networkx(self):
     import networkx as nx
     G = nx.Graph()
-    
-    for idx, v in enumerate(self.vertices):
-      G.add_node(idx)
-      for u in v.neighbors:
-        
-        G.add_edge(idx, u)
-      G.nodes[idx]['vop'] = v.vop_code
-    
+    G.add_nodes_from((idx, {'vop': vop}) for idx, vop in enumerate(self._vop))
+    G.add_edges_from(self.edge_array().tolist())
+
     return G
 
   def draw(self):
@@ -259,3 +651,71 @@ class GraphState(object):
 
     nx.draw_networkx_labels(G, pos_attrs, labels=custom_node_attrs)
     plt.show()
+
+
+########################################################
+# Pauli operators
+########################################################
+
+PAULIS = {'I': 0, '_': 0, 'X': 1, 'Y': 2, 'Z': 3}
+
+# Byte translation of Pauli letters to basis codes, 255 for anything else
+PAULI_CODES = bytes(PAULIS.get(chr(c).upper(), 255) for c in range(256))
+
+def pauli_terms(pauli):
+  # `(sign, qubits, bases)` of the non-identity terms of a Pauli string
+  # such as '-XIZ' or a dict such as {0: 'X', 2: 'Z'}
+  if isinstance(pauli, dict):
+    sign = 1
+    qubits = list(pauli)
+    codes = ''.join(pauli.values()).encode().translate(PAULI_CODES)
+  else:
+    sign = -1 if pauli.startswith('-') else 1
+    codes = pauli.lstrip('+-').encode().translate(PAULI_CODES)
+    qubits = range(len(codes))
+
+  if len(codes) != len(qubits) or 255 in codes:
+    raise ValueError("Invalid Pauli operator {!r}".format(pauli))
+
+  qubits = [q for q, code in zip(qubits, codes) if code]
+  return sign, qubits, [code for code in codes if code]
+
+
+########################################################
+# Random number generation
+#
+# A state draws its measurement outcomes from `rng`, which is
+# either the global `random` module (the default), a
+# `random.Random` or a NumPy `Generator`. An int is taken as
+# the seed of a new `random.Random`.
+########################################################
+
+def make_rng(rng):
+  if rng is None:
+    return random
+  if isinstance(rng, numbers.Integral):
+    return random.Random(int(rng))
+  return rng
+
+def seeded_rng(seed_sequence):
+  # A `random.Random` seeded from a NumPy `SeedSequence`, such as one
+  # spawned for a chunk of work
+  return random.Random(int.from_bytes(seed_sequence.generate_state(4).tobytes(), 'little'))
+
+def random_bit(rng):
+  if hasattr(rng, 'getrandbits'):
+    return rng.getrandbits(1)
+  return int(rng.integers(2))
+
+def random_bits(rng, rows, columns):
+  import numpy as np
+
+  if not hasattr(rng, 'getrandbits'):
+    return rng.integers(0, 2, size=(rows, columns), dtype=np.uint8)
+
+  count = rows * columns
+  if count == 0:
+    return np.zeros((rows, columns), dtype=np.uint8)
+  size = (count + 7) // 8
+  data = rng.getrandbits(8 * size).to_bytes(size, 'little')
+  return np.unpackbits(np.frombuffer(data, dtype=np.uint8))[:count].reshape(rows, columns)
@@ -0,0 +1,144 @@
+import os
+
+from .circuit import CZ, MEASURE, Circuit, as_operations
+from .graph_state import GraphState, seeded_rng
+
+########################################################
+# Parallel shot execution
+#
+# Shots are cut into fixed-size chunks, and chunk i always
+# draws its outcomes from the i-th stream spawned from the
+# seed. The chunks a worker happens to receive therefore
+# never change the result: the same seed gives the same
+# bits for any number of workers.
+########################################################
+
+def run_shots(num_qubits, circuit, shots, seed=None, workers=None, chunk_size=256, adjacency='auto'):
+  import numpy as np
+
+  if not isinstance(circuit, Circuit):
+    circuit = Circuit.from_array(circuit)
+
+  sizes = [min(chunk_size, shots - start) for start in range(0, shots, chunk_size)]
+  seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+
+  if workers == 1 or len(sizes) <= 1:
+    init_worker(num_qubits, circuit, adjacency)
+    try:
+      records = [run_chunk(size, chunk_seed) for size, chunk_seed in zip(sizes, seeds)]
+    finally:
+      worker_job.clear()
+  else:
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(workers, initializer=init_worker, initargs=(num_qubits, circuit, adjacency)) as pool:
+      records = list(pool.map(run_chunk, sizes, seeds))
+
+  if not records:
+    num_measurements = sum(1 for opcode, _, _ in as_operations(circuit) if opcode == MEASURE)
+    return np.zeros((0, num_measurements), dtype=np.uint8)
+
+  return np.concatenate(records)
+
+
+# The circuit is shipped to each worker once, not once per chunk
+worker_job = {}
+
+def init_worker(num_qubits, circuit, adjacency):
+  worker_job.update(num_qubits=num_qubits, circuit=circuit, adjacency=adjacency)
+
+def run_chunk(size, seed):
+  import numpy as np
+
+  rng = seeded_rng(seed)
+  num_qubits, circuit, adjacency = worker_job['num_qubits'], worker_job['circuit'], worker_job['adjacency']
+
+  return np.array([GraphState(num_qubits, adjacency, rng).run(circuit) for _ in range(size)],
+                  dtype=np.uint8).reshape(size, -1)
+
+
+########################################################
+# Parallel components
+#
+# Qubits that share no component, and that no CZ of the
+# circuit joins, evolve independently. Such groups are cut
+# out of the state, run as separate jobs and merged back.
+# As for shots, group i draws its outcomes from the i-th
+# stream spawned from the seed.
+########################################################
+
+def run_components(graph_state, circuit, seed=None, workers=None):
+  # `graph_state.run(circuit)`, one job per independent group of qubits
+  import numpy as np
+
+  ops = circuit.to_array() if isinstance(circuit, Circuit) else np.asarray(circuit, dtype=np.int32).reshape(-1, 3)
+  opcode, a, b = ops[:, 0], ops[:, 1].astype(np.int64), ops[:, 2].astype(np.int64)
+  is_cz = opcode == CZ
+
+  # Every touched qubit starts in the group of its component
+  touched = np.unique(np.concatenate([a, b[is_cz]]))
+  owner = np.full(graph_state.num_nodes, -1, dtype=np.int64)
+  factors = {}
+  for t in touched.tolist():
+    if owner[t] < 0:
+      vertices = graph_state.component(t)
+      owner[vertices] = vertices[0]
+      factors[vertices[0]] = vertices
+
+  # and groups are joined by the CZs between them
+  parent = {root: root for root in factors}
+  pairs = np.column_stack([owner[a[is_cz]], owner[b[is_cz]]])
+  for u, v in np.unique(pairs[pairs[:, 0] != pairs[:, 1]], axis=0).tolist():
+    parent[find(parent, u)] = find(parent, v)
+
+  groups = {}
+  for root in factors:
+    groups.setdefault(find(parent, root), []).append(root)
+  groups = [sorted(v for root in roots for v in factors[root]) for roots in groups.values()]
+
+  # Each group's operations, in circuit order and on its own qubit numbers
+  local = np.zeros(graph_state.num_nodes, dtype=np.int32)
+  group = np.zeros(graph_state.num_nodes, dtype=np.int64)
+  for i, vertices in enumerate(groups):
+    local[vertices] = np.arange(len(vertices), dtype=np.int32)
+    group[vertices] = i
+
+  local_ops = np.column_stack([opcode, local[a], b]).astype(np.int32)
+  local_ops[is_cz, 2] = local[b[is_cz]]
+  op_group = group[a]
+  order = np.argsort(op_group, kind='stable')
+  bounds = np.searchsorted(op_group[order], np.arange(len(groups) + 1))
+  jobs = [local_ops[order[start:end]] for start, end in zip(bounds[:-1], bounds[1:])]
+
+  seeds = np.random.SeedSequence(seed).spawn(len(groups))
+  states = []
+  for vertices, group_seed in zip(groups, seeds):
+    state = graph_state.substate(vertices)
+    state.rng = seeded_rng(group_seed)
+    states.append(state)
+
+  if workers == 1 or len(groups) <= 1:
+    done = [run_group(state, job) for state, job in zip(states, jobs)]
+  else:
+    from concurrent.futures import ProcessPoolExecutor
+    chunksize = max(1, len(groups) // (4 * (workers or os.cpu_count() or 1)))
+    with ProcessPoolExecutor(workers) as pool:
+      done = list(pool.map(run_group, states, jobs, chunksize=chunksize))
+
+  graph_state.merge((vertices, state) for vertices, (state, _) in zip(groups, done))
+
+  # Results go back to the positions of their measurements in the circuit
+  is_measure = opcode == MEASURE
+  results = np.zeros(int(is_measure.sum()), dtype=np.uint8)
+  if len(results):
+    measured = order[is_measure[order]]
+    results[np.cumsum(is_measure)[measured] - 1] = np.concatenate([outcomes for _, outcomes in done])
+  return results
+
+def run_group(state, ops):
+  return state, state.run(ops)
+
+def find(parent, u):
+  while parent[u] != u:
+    parent[u] = parent[parent[u]]
+    u = parent[u]
+  return u
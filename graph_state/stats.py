@@ -0,0 +1,147 @@
+import time
+from collections import Counter, defaultdict
+
+########################################################
+# Opt-in instrumentation
+#
+# Enabling stats shadows the instrumented methods of one
+# GraphState (and of its adjacency) with counting wrappers
+# stored on the instance. Disabling deletes the wrappers,
+# so a state without stats runs the plain class methods.
+########################################################
+
+# Gates are counted as the primitives that reach the graph: single-qubit
+# Cliffords by name (every gate method goes through `apply`, and `run`
+# counts the ones it folds), CZs and measurements by basis. A CX
+# therefore counts as two H and one CZ.
+GATE_NAMES = {1: 'x', 2: 'y', 3: 'z', 5: 's_dagger', 6: 's', 10: 'h'}
+
+TIMED = ('apply', 'cz', 'cx', 'measure', 'run', 'sample', 'reduce_vop', 'local_complementation',
+         'bare_measure_x', 'bare_measure_y', 'bare_measure_z', 'edge_array')
+EDGE_KERNELS = ('toggle_edge', 'add_edge', 'remove_edge', 'complement', 'toggle_bipartite')
+
+class Stats(object):
+  def __init__(self):
+    self.callbacks = []
+    self.reset()
+
+  def reset(self):
+    self.gates = Counter()
+    self.calls = Counter()
+    self.time = defaultdict(float)
+    self.local_complementations = 0
+    self.edge_toggles = 0
+    self.neighborhood_sizes = Counter()
+
+  def count_gate(self, vop):
+    self.gates[GATE_NAMES.get(vop, 'clifford_{}'.format(vop))] += 1
+
+  def add_callback(self, callback):
+    # `callback(name, seconds, args)` runs after every instrumented call
+    self.callbacks.append(callback)
+
+  def record(self, name, seconds, args):
+    self.calls[name] += 1
+    self.time[name] += seconds
+    for callback in self.callbacks:
+      callback(name, seconds, args)
+
+  def as_dict(self):
+    return {
+      'gates': dict(self.gates),
+      'calls': dict(self.calls),
+      'time': dict(self.time),
+      'local_complementations': self.local_complementations,
+      'edge_toggles': self.edge_toggles,
+      'neighborhood_sizes': dict(sorted(self.neighborhood_sizes.items())),
+    }
+
+  def __str__(self):
+    lines = ['{:<24} {:>10} {:>12.6f}s'.format(name, self.calls[name], self.time[name])
+             for name in sorted(self.calls, key=self.time.get, reverse=True)]
+    lines.append('local complementations: {}'.format(self.local_complementations))
+    lines.append('edge toggles: {}'.format(self.edge_toggles))
+    return '\n'.join(lines)
+
+
+def timed(stats, name, method):
+  perf_counter = time.perf_counter
+
+  def wrapper(*args, **kwargs):
+    start = perf_counter()
+    result = method(*args, **kwargs)
+    stats.record(name, perf_counter() - start, args)
+    return result
+
+  return wrapper
+
+def instrument(graph_state, stats):
+  for name in TIMED:
+    setattr(graph_state, name, timed(stats, name, getattr(graph_state, name)))
+
+  apply = graph_state.apply
+  def apply_wrapper(vop, target):
+    stats.count_gate(vop)
+    apply(vop, target)
+  graph_state.apply = apply_wrapper
+
+  cz = graph_state.cz
+  def cz_wrapper(control, target):
+    stats.gates['cz'] += 1
+    cz(control, target)
+  graph_state.cz = cz_wrapper
+
+  measure = graph_state.measure
+  def measure_wrapper(target, basis='Z', force=None):
+    stats.gates['measure_' + (basis if basis in ('X', 'Y') else 'Z')] += 1
+    return measure(target, basis, force)
+  graph_state.measure = measure_wrapper
+
+  local_complementation = graph_state.local_complementation
+  def local_complementation_wrapper(a, times=1):
+    # One call stands for `times` complementations, of which every fourth
+    # cancels out
+    if times % 4:
+      stats.local_complementations += times % 4
+      stats.neighborhood_sizes[graph_state.degree(a)] += times % 4
+    return local_complementation(a, times)
+  graph_state.local_complementation = local_complementation_wrapper
+
+  adjacency = graph_state.adjacency
+  toggle_edge, add_edge, remove_edge, complement, toggle_bipartite = (getattr(adjacency, name)
+                                                                      for name in EDGE_KERNELS)
+
+  def toggle_edge_wrapper(a, b):
+    stats.edge_toggles += 1
+    toggle_edge(a, b)
+
+  def add_edge_wrapper(a, b):
+    stats.edge_toggles += 1
+    add_edge(a, b)
+
+  def remove_edge_wrapper(a, b):
+    stats.edge_toggles += 1
+    remove_edge(a, b)
+
+  def complement_wrapper(vertices):
+    vertices = set(vertices)
+    stats.edge_toggles += len(vertices) * (len(vertices) - 1) // 2
+    complement(vertices)
+
+  def toggle_bipartite_wrapper(a, b):
+    a, b = set(a), set(b)
+    shared = len(a & b)
+    stats.edge_toggles += len(a) * len(b) - shared - shared * (shared - 1) // 2
+    toggle_bipartite(a, b)
+
+  adjacency.toggle_edge = toggle_edge_wrapper
+  adjacency.add_edge = add_edge_wrapper
+  adjacency.remove_edge = remove_edge_wrapper
+  adjacency.complement = complement_wrapper
+  adjacency.toggle_bipartite = toggle_bipartite_wrapper
+
+def uninstrument(graph_state):
+  for name in TIMED:
+    graph_state.__dict__.pop(name, None)
+  for name in EDGE_KERNELS:
+    graph_state.adjacency.__dict__.pop(name, None)
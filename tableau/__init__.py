@@ -0,0 +1 @@
+from .tableau import Tableau
\ No newline at end of file
@@ -0,0 +1,326 @@
+import numpy as np
+
+from graph_state import GraphState
+from graph_state.graph_state import make_rng, random_bit
+from graph_state.lookup_tables import conjugation_table, decomposition_table, multiplication_table
+
+########################################################
+# Stabilizer tableau (Aaronson & Gottesman, CHP)
+#
+# Rows 0..n-1 are the destabilizers, rows n..2n-1 the
+# stabilizers and row 2n is scratch space. The X and Z
+# parts of each row are packed 64 qubits to a `uint64`
+# word, so a gate on qubit a touches one word column and
+# updates every row at once.
+########################################################
+
+if hasattr(np, 'bitwise_count'):
+  popcount = np.bitwise_count
+else:
+  POPCOUNT_TABLE = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+  def popcount(words):
+    return POPCOUNT_TABLE[words.view(np.uint8)].reshape(words.shape + (8,)).sum(axis=-1)
+
+def parity(words):
+  # Parity of the number of set bits in each row of `words`
+  return (popcount(words).sum(axis=-1) & 1).astype(np.uint8)
+
+def word_and_mask(a):
+  return a >> 6, np.uint64(1 << (a & 63))
+
+def qubit_mask(qubits, num_words):
+  qubits = np.asarray(qubits, dtype=np.int64)
+  mask = np.zeros(num_words, dtype=np.uint64)
+  np.bitwise_or.at(mask, qubits >> 6, np.left_shift(np.uint64(1), (qubits & 63).astype(np.uint64)))
+  return mask
+
+def rowsum(x, z, r, targets, source):
+  # Every row in `targets` becomes its product with row `source`
+  x1, z1 = x[source], z[source]
+  x2, z2 = x[targets], z[targets]
+
+  plus = (x1 & z1 & z2 & ~x2) | (x1 & ~z1 & x2 & z2) | (~x1 & z1 & x2 & ~z2)
+  minus = (x1 & z1 & x2 & ~z2) | (x1 & ~z1 & ~x2 & z2) | (~x1 & z1 & x2 & z2)
+  g = popcount(plus).sum(axis=1, dtype=np.int64) - popcount(minus).sum(axis=1, dtype=np.int64)
+
+  phase = 2 * r[targets].astype(np.int64) + 2 * int(r[source]) + g
+  r[targets] = (phase % 4 == 2)
+  x[targets] = x2 ^ x1
+  z[targets] = z2 ^ z1
+
+# Layers of one single-qubit gate applied to every qubit in `mask`
+
+def h_layer(x, z, r, mask):
+  r ^= parity(x & z & mask)
+  t = (x ^ z) & mask
+  x ^= t
+  z ^= t
+
+def s_layer(x, z, r, mask):
+  r ^= parity(x & z & mask)
+  z ^= x & mask
+
+def s_dagger_layer(x, z, r, mask):
+  r ^= parity(x & ~z & mask)
+  z ^= x & mask
+
+def eliminate(x, z, r, matrix, columns, start=0):
+  # Gauss-Jordan elimination of `matrix` (`x` or `z`) over `columns`,
+  # using rows from `start` onwards as pivots. Returns the pivot columns.
+  pivots = []
+  row = start
+  for col in columns:
+    w, m = word_and_mask(col)
+    candidates = np.flatnonzero(matrix[row:, w] & m) + row
+    if len(candidates) == 0:
+      continue
+
+    p = candidates[0]
+    if p != row:
+      for array in (x, z, r):
+        array[[row, p]] = array[[p, row]]
+
+    others = np.flatnonzero(matrix[:, w] & m)
+    others = others[others != row]
+    if len(others):
+      rowsum(x, z, r, others, row)
+
+    pivots.append(col)
+    row += 1
+    if row == len(r):
+      break
+
+  return pivots
+
+
+class Tableau(object):
+  def __init__(self, num_qubits, rng=None):
+    self.n = num_qubits
+    self.num_words = (num_qubits + 63) // 64
+    self.rng = make_rng(rng)
+
+    self.x = np.zeros((2 * num_qubits + 1, self.num_words), dtype=np.uint64)
+    self.z = np.zeros((2 * num_qubits + 1, self.num_words), dtype=np.uint64)
+    self.r = np.zeros(2 * num_qubits + 1, dtype=np.uint8)
+
+    # Destabilizer X_a and stabilizer Z_a for every qubit: the state |0...0>
+    qubits = np.arange(num_qubits)
+    bits = np.left_shift(np.uint64(1), (qubits & 63).astype(np.uint64))
+    self.x[qubits, qubits >> 6] = bits
+    self.z[num_qubits + qubits, qubits >> 6] = bits
+
+  ########################################################
+  # Gates
+  ########################################################
+
+  def column(self, a):
+    w, m = word_and_mask(a)
+    return self.x[:, w], self.z[:, w], m
+
+  def h(self, a):
+    x, z, m = self.column(a)
+    self.r ^= (x & z & m) != 0
+    t = (x ^ z) & m
+    x ^= t
+    z ^= t
+
+  def s(self, a):
+    x, z, m = self.column(a)
+    self.r ^= (x & z & m) != 0
+    z ^= x & m
+
+  def s_dagger(self, a):
+    x, z, m = self.column(a)
+    self.r ^= (x & ~z & m) != 0
+    z ^= x & m
+
+  def x_gate(self, a):
+    x, z, m = self.column(a)
+    self.r ^= (z & m) != 0
+
+  def y_gate(self, a):
+    x, z, m = self.column(a)
+    self.r ^= ((x ^ z) & m) != 0
+
+  def z_gate(self, a):
+    x, z, m = self.column(a)
+    self.r ^= (x & m) != 0
+
+  def apply(self, vop, target):
+    # Apply the local Clifford with code `vop`, as a product of
+    # sqrt(-iX) ~ H S H and sqrt(iZ) ~ S^dagger
+    for factor in reversed(decomposition_table[vop]):
+      if factor == 'X':
+        self.h(target)
+        self.s(target)
+        self.h(target)
+      else:
+        self.s_dagger(target)
+
+  def cx(self, a, b):
+    xa, za, ma = self.column(a)
+    xb, zb, mb = self.column(b)
+    bit_xa, bit_za = (xa & ma) != 0, (za & ma) != 0
+    bit_xb, bit_zb = (xb & mb) != 0, (zb & mb) != 0
+
+    self.r ^= bit_xa & bit_zb & ~(bit_xb ^ bit_za)
+    xb ^= np.where(bit_xa, mb, np.uint64(0))
+    za ^= np.where(bit_zb, ma, np.uint64(0))
+
+  def cz(self, a, b):
+    self.h(b)
+    self.cx(a, b)
+    self.h(b)
+
+  ########################################################
+  # Measurement
+  ########################################################
+
+  def measure(self, a, basis='Z', force=None):
+    if basis == 'X':
+      self.h(a)
+    elif basis == 'Y':
+      self.s_dagger(a)
+      self.h(a)
+
+    outcome = self.measure_z(a, force)
+
+    if basis == 'X':
+      self.h(a)
+    elif basis == 'Y':
+      self.h(a)
+      self.s(a)
+
+    return outcome
+
+  def measure_z(self, a, force=None):
+    n = self.n
+    w, m = word_and_mask(a)
+    stabilizers = np.flatnonzero(self.x[n:2 * n, w] & m)
+
+    if len(stabilizers):
+      # Random outcome
+      p = n + stabilizers[0]
+      rows = np.flatnonzero(self.x[:2 * n, w] & m)
+      rows = rows[rows != p]
+      if len(rows):
+        rowsum(self.x, self.z, self.r, rows, p)
+
+      self.x[p - n], self.z[p - n], self.r[p - n] = self.x[p], self.z[p], self.r[p]
+      self.x[p] = 0
+      self.z[p] = 0
+      self.z[p, w] = m
+
+      outcome = random_bit(self.rng) if force is None else force
+      self.r[p] = outcome
+      return int(outcome)
+
+    # Deterministic outcome, accumulated in the scratch row
+    scratch = 2 * n
+    self.x[scratch] = 0
+    self.z[scratch] = 0
+    self.r[scratch] = 0
+    for i in np.flatnonzero(self.x[:n, w] & m):
+      rowsum(self.x, self.z, self.r, [scratch], n + i)
+
+    return int(self.r[scratch])
+
+  ########################################################
+  # Comparison and conversion
+  ########################################################
+
+  def stabilizers(self):
+    n = self.n
+    return self.x[n:2 * n].copy(), self.z[n:2 * n].copy(), self.r[n:2 * n].copy()
+
+  def canonical(self):
+    # Reduced row echelon form of the stabilizer group, which is
+    # the same for any two tableaux describing the same state
+    x, z, r = self.stabilizers()
+    pivots = eliminate(x, z, r, x, range(self.n))
+    eliminate(x, z, r, z, range(self.n), start=len(pivots))
+    return x, z, r
+
+  def __eq__(self, other):
+    if not isinstance(other, Tableau) or self.n != other.n:
+      return NotImplemented
+    return all((a == b).all() for a, b in zip(self.canonical(), other.canonical()))
+
+  def __str__(self):
+    return np.array2string(self.bits())
+
+  def bits(self):
+    # The unpacked `[x | z | r]` matrix of destabilizers and stabilizers
+    rows = 2 * self.n
+    x = np.unpackbits(self.x[:rows].view(np.uint8), axis=1, bitorder='little')[:, :self.n]
+    z = np.unpackbits(self.z[:rows].view(np.uint8), axis=1, bitorder='little')[:, :self.n]
+    return np.hstack([x, z, self.r[:rows, None]])
+
+  @classmethod
+  def from_graph_state(cls, graph_state, rng=None):
+    n = graph_state.num_nodes
+    tableau = cls(n, rng)
+    x, z, r = tableau.x, tableau.z, tableau.r
+
+    # |G> is stabilized by X_a Z_N(a) and destabilized by Z_a
+    qubits = np.arange(n)
+    bits = np.left_shift(np.uint64(1), (qubits & 63).astype(np.uint64))
+    x[:] = 0
+    z[:] = 0
+    z[qubits, qubits >> 6] = bits
+    x[n + qubits, qubits >> 6] = bits
+
+    edges = graph_state.edge_array().astype(np.int64)
+    for a, b in ((edges[:, 0], edges[:, 1]), (edges[:, 1], edges[:, 0])):
+      np.bitwise_or.at(z, (n + a, b >> 6), np.left_shift(np.uint64(1), (b & 63).astype(np.uint64)))
+
+    # Then conjugate by the VOPs, every qubit sharing a VOP at once
+    vops = np.asarray(graph_state.vops)
+    for vop in np.unique(vops):
+      if vop == 0:
+        continue
+      mask = qubit_mask(np.flatnonzero(vops == vop), tableau.num_words)
+      for factor in reversed(decomposition_table[vop]):
+        if factor == 'X':
+          h_layer(x, z, r, mask)
+          s_layer(x, z, r, mask)
+          h_layer(x, z, r, mask)
+        else:
+          s_dagger_layer(x, z, r, mask)
+
+    return tableau
+
+  def to_graph_state(self, **kwargs):
+    # Find local Cliffords C with C|psi> = |G> (Van den Nest et al.), then
+    # |psi> = C^dagger |G>, so the VOP of each qubit is C^dagger
+    n = self.n
+    x, z, r = self.stabilizers()
+    local = np.zeros(n, dtype=np.int64)
+
+    # Hadamards on the columns where the X block lacks a pivot make it invertible
+    pivots = eliminate(x, z, r, x, range(n))
+    missing = np.setdiff1d(np.arange(n), pivots)
+    if len(missing):
+      h_layer(x, z, r, qubit_mask(missing, self.num_words))
+      local[missing] = multiplication_table[10, local[missing]]
+      eliminate(x, z, r, x, range(n))
+
+    # Now row a is +-X_a Z_N(a), possibly with a Z_a (a Y) on the diagonal
+    bits = np.unpackbits(z.view(np.uint8), axis=1, bitorder='little')[:, :n]
+    diagonal = np.flatnonzero(np.diagonal(bits))
+    if len(diagonal):
+      s_dagger_layer(x, z, r, qubit_mask(diagonal, self.num_words))
+      local[diagonal] = multiplication_table[5, local[diagonal]]
+      bits[diagonal, diagonal] = 0
+
+    negative = np.flatnonzero(r)
+    if len(negative):
+      local[negative] = multiplication_table[3, local[negative]]
+
+    graph_state = GraphState(n, **kwargs)
+    graph_state.vops[:] = conjugation_table[local]
+    for a, b in zip(*np.nonzero(np.triu(bits, 1))):
+      graph_state.add_edge(int(a), int(b))
+
+    return graph_state
@@ -0,0 +1,96 @@
+from functools import reduce
+
+import numpy as np
+
+from graph_state import GraphState
+from graph_state.lookup_tables import decomposition_table
+
+########################################################
+# State-vector reference
+#
+# A dense 2^n amplitude vector with qubit 0 as the most
+# significant index, small enough to check the graph state
+# simulator on a handful of qubits.
+########################################################
+
+I = np.eye(2)
+X = np.array([[0, 1], [1, 0]])
+Y = np.array([[0, -1j], [1j, 0]])
+Z = np.diag([1, -1])
+PAULI_MATRICES = {'I': I, 'X': X, 'Y': Y, 'Z': Z}
+
+# Every VOP as its decomposition into sqrt(-iX) and sqrt(iZ)
+SQRT_X = (I - 1j * X) / np.sqrt(2)
+SQRT_Z = (I + 1j * Z) / np.sqrt(2)
+VOP_MATRICES = [reduce(np.dot, [SQRT_X if f == 'X' else SQRT_Z for f in d], I) for d in decomposition_table]
+
+def zero_state(n):
+  psi = np.zeros(2 ** n, dtype=complex)
+  psi[0] = 1
+  return psi
+
+def apply(psi, u, q, n):
+  psi = np.tensordot(u, psi.reshape([2] * n), axes=([1], [q]))
+  return np.moveaxis(psi, 0, q).reshape(-1)
+
+def cz(psi, a, b, n):
+  psi = psi.reshape([2] * n).copy()
+  index = [slice(None)] * n
+  index[a] = index[b] = 1
+  psi[tuple(index)] *= -1
+  return psi.reshape(-1)
+
+def measure(psi, q, basis, outcome, n):
+  # The state after `outcome` of measuring `q` in `basis`, and its probability
+  projector = (I + (-1) ** outcome * PAULI_MATRICES[basis]) / 2
+  out = apply(psi, projector, q, n)
+  p = np.vdot(out, out).real
+  return (out / np.sqrt(p) if p > 1e-9 else None), p
+
+def graph_vector(graph_state):
+  # The state vector a GraphState describes: CZs on |+...+>, then the VOPs
+  n = graph_state.num_nodes
+  psi = np.full(2 ** n, 2 ** (-n / 2), dtype=complex)
+  for a, b in graph_state.edges():
+    psi = cz(psi, a, b, n)
+  for q, vop in enumerate(graph_state.vops):
+    psi = apply(psi, VOP_MATRICES[vop], q, n)
+  return psi
+
+def same_state(a, b):
+  # Equal up to a global phase
+  k = np.argmax(np.abs(b))
+  return abs(a[k]) > 1e-9 and np.allclose(a * (b[k] / a[k]), b, atol=1e-7)
+
+def pauli_matrix(pauli):
+  sign = -1 if pauli.startswith('-') else 1
+  return sign * reduce(np.kron, [PAULI_MATRICES[p] for p in pauli.lstrip('+-')])
+
+def distribution(psi, targets, bases, n):
+  # Exact probabilities of the outcomes of measuring `targets` in order
+  result = {}
+  def branch(psi, i, outcomes, p):
+    if i == len(targets):
+      result[outcomes] = p
+      return
+    for outcome in (0, 1):
+      after, q = measure(psi, targets[i], bases[i], outcome, n)
+      if after is not None:
+        branch(after, i + 1, outcomes + (outcome,), p * q)
+  branch(psi, 0, (), 1.0)
+  return result
+
+def random_state(n, steps, rng, adjacency='auto'):
+  # A random graph state and its state vector
+  g = GraphState(n, adjacency, rng=rng.randrange(2 ** 32))
+  psi = zero_state(n)
+  for _ in range(steps):
+    if n > 1 and rng.random() < 0.5:
+      a, b = rng.sample(range(n), 2)
+      g.cz(a, b)
+      psi = cz(psi, a, b, n)
+    else:
+      vop, q = rng.randrange(24), rng.randrange(n)
+      g.apply(vop, q)
+      psi = apply(psi, VOP_MATRICES[vop], q, n)
+  return g, psi
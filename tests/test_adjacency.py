@@ -0,0 +1,30 @@
+import pytest
+
+from graph_state import GraphState
+
+@pytest.mark.parametrize('adjacency', ['sparse', 'bitset'])
+def test_add_edge_is_idempotent(adjacency):
+  g = GraphState(5, adjacency)
+  g.add_edge(0, 1)
+  g.add_edge(0, 3)
+  g.add_edge(1, 0)
+  assert g.neighbors(0) == [1, 3]
+  assert g.neighbors(1) == [0]
+  assert list(g.edges()) == [(0, 1), (0, 3)]
+
+@pytest.mark.parametrize('adjacency', ['sparse', 'bitset'])
+def test_remove_missing_edge(adjacency):
+  g = GraphState(5, adjacency)
+  g.add_edge(0, 1)
+  g.add_edge(0, 3)
+  g.add_edge(2, 4)
+
+  for a, b in ((0, 2), (2, 0), (1, 3), (0, 4)):
+    with pytest.raises(KeyError):
+      g.remove_edge(a, b)
+  assert list(g.edges()) == [(0, 1), (0, 3), (2, 4)]
+  assert [g.neighbors(a) for a in range(5)] == [[1, 3], [0], [4], [0], [2]]
+
+  g.remove_edge(3, 0)
+  assert list(g.edges()) == [(0, 1), (2, 4)]
+  assert g.degree(3) == 0
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from graph_state import GraphState
+
+import statevector as sv
+
+def random_graph_state(n, rng, adjacency):
+  g = GraphState(n, adjacency)
+  for _ in range(3 * n):
+    a, b = rng.randrange(n), rng.randrange(n)
+    g.apply(rng.randrange(24), a)
+    if a != b:
+      g.cz(a, b)
+  return g
+
+@pytest.mark.parametrize('adjacency', ['sparse', 'bitset'])
+def test_round_trip(tmp_path, adjacency):
+  rng = random.Random(1)
+  for n in (0, 1, 5, 40):
+    g = random_graph_state(n, rng, adjacency)
+    path = str(tmp_path / 'state.gs')
+    g.save(path)
+
+    h = GraphState.load(path, adjacency)
+    assert len(h) == n
+    assert bytes(h.vops) == bytes(g.vops)
+    assert list(h.edges()) == list(g.edges())
+    assert h.edge_array().tolist() == g.edge_array().tolist()
+    for a in range(n):
+      assert h.degree(a) == g.degree(a) and h.neighbors(a) == g.neighbors(a)
+      assert all(h.has_edge(a, b) == g.has_edge(a, b) for b in range(n))
+
+    if n:
+      targets = list(range(min(n, 6)))
+      g.rng, h.rng = random.Random(2), random.Random(2)
+      assert (h.sample(targets, 200) == g.sample(targets, 200)).all()
+
+      f = h.fork()
+      assert type(f.adjacency) is type(g.adjacency)
+      f.rng, g.rng = random.Random(3), random.Random(3)
+      assert [f.measure(a, 'X') for a in range(n)] == [g.measure(a, 'X') for a in range(n)]
+      assert list(f.edges()) == list(g.edges())
+
+def test_state_vector(tmp_path):
+  g, psi = sv.random_state(5, 20, random.Random(4))
+  g.save(str(tmp_path / 'state.gs'))
+  assert sv.same_state(sv.graph_vector(GraphState.load(str(tmp_path / 'state.gs'))), psi)
+
+def test_loaded_state_is_read_only(tmp_path):
+  g = GraphState(4)
+  g.h(0)
+  for a in range(1, 4):
+    g.cx(0, a)
+  g.save(str(tmp_path / 'state.gs'))
+  h = GraphState.load(str(tmp_path / 'state.gs'))
+
+  for write in (lambda: h.apply(10, 0), lambda: h.h(3), lambda: h.cz(1, 2), lambda: h.measure(0),
+                lambda: h.measure(1, 'X'), lambda: h.add_edge(1, 2), lambda: h.remove_edge(0, 1),
+                lambda: h.local_complementation(0)):
+    with pytest.raises(TypeError):
+      write()
+  assert list(h.edges()) == list(g.edges()) and bytes(h.vops) == bytes(g.vops)
+
+  f = h.fork()
+  f.h(3)
+  f.measure(0)
+
+def test_not_a_checkpoint(tmp_path):
+  path = tmp_path / 'other.gs'
+  path.write_bytes(b'not a checkpoint at all')
+  with pytest.raises(ValueError):
+    GraphState.load(str(path))
@@ -0,0 +1,70 @@
+import io
+import random
+from array import array
+
+import numpy as np
+import pytest
+
+from graph_state import GraphState, run_file, read_circuit, read_measurements
+from graph_state.circuit import APPLY
+from graph_state.circuit_file import parse_chunk, parse_line
+
+TOKENS = ['H', 'h', 'X', 'Y', 'Z', 'S', 'S_DAG', 'SQRT_Z', 'I', 'M', 'MX', 'my', 'MZ', 'CZ', 'CX', 'CNOT',
+          'TICK', 'FOO', 'H2', '0', '1', '7', '12', '007', '3a', '-1', '1234567890', '2147483647', '2147483648', '9999999999', '#', '# CZ 0']
+SEPARATORS = [' ', '  ', '\t', '\x0b', '\x0c', '\x1c', '\x01', '\n', '\n\n', ' \n']
+
+def reference(text):
+  # The operations of `text` parsed one line at a time, or None if it is invalid
+  ops = array('i')
+  try:
+    for line in io.StringIO(text):
+      parse_line(line, ops)
+  except ValueError:
+    return None
+  return np.array(ops, dtype=np.int32).reshape(-1, 3)
+
+def test_chunk_parser_matches_line_parser():
+  rng = random.Random(1)
+  for _ in range(3000):
+    text = ''.join(rng.choice(TOKENS) + rng.choice(SEPARATORS) for _ in range(rng.randint(0, 12)))
+    expected = reference(text)
+
+    try:
+      ops = parse_chunk(io.StringIO(text).readlines())
+    except ValueError:
+      ops = None
+    if ops is not None:
+      assert expected is not None and ops.tolist() == expected.tolist(), repr(text)
+
+    try:
+      circuits = list(read_circuit(io.StringIO(text), chunk_size=rng.randint(1, 4)))
+    except ValueError:
+      assert expected is None, repr(text)
+    else:
+      assert expected is not None, repr(text)
+      assert np.concatenate([c.to_array() for c in circuits] + [np.zeros((0, 3), np.int32)]).tolist() == expected.tolist()
+
+@pytest.mark.parametrize('text', ['H 0\n5\n', 'CZ 0\n1\n', 'H 0 CZ 1 2\n', '5\n'])
+def test_targets_do_not_run_on(text):
+  with pytest.raises(ValueError):
+    list(read_circuit(io.StringIO(text)))
+
+@pytest.mark.parametrize('text', ['H 9999999999\n', 'M 2147483648\n', 'CZ 1 1\n', 'CZ 0 1 2 2\n', 'CX 2 2\n', 'CNOT 3 3\n'])
+def test_invalid_targets(text):
+  with pytest.raises(ValueError, match='Line 2'):
+    list(read_circuit(io.StringIO('H 0\n' + text)))
+
+def test_largest_target():
+  ops = array('i')
+  parse_line('H 2147483647', ops)
+  assert list(ops) == [APPLY, 2 ** 31 - 1, 10]
+
+def test_run_file(tmp_path):
+  path = tmp_path / 'circuit.txt'
+  path.write_text('H 0\nCX 0 1\n# Bell pair\nM 0 1\nX 2\nM 2 2 2 2 2 2 2 2\n')
+
+  g = GraphState(3)
+  count = run_file(g, str(path), str(tmp_path / 'results.bin'), chunk_size=2)
+  bits = read_measurements(str(tmp_path / 'results.bin'), count)
+  assert count == 10
+  assert bits[0] == bits[1] and (bits[2:] == 1).all()
@@ -0,0 +1,117 @@
+import random
+
+import pytest
+
+from graph_state import GraphState, Circuit, run_components
+
+def brute_force_components(g):
+  label = list(range(g.num_nodes))
+  def find(a):
+    while label[a] != a:
+      a = label[a]
+    return a
+  for a, b in g.edges():
+    label[find(a)] = find(b)
+  groups = {}
+  for a in range(g.num_nodes):
+    groups.setdefault(find(a), []).append(a)
+  return sorted(groups.values())
+
+@pytest.mark.parametrize('adjacency', ['sparse', 'bitset'])
+def test_tracking(adjacency):
+  rng = random.Random(1)
+  for trial in range(150):
+    n = rng.randint(1, 30)
+    g = GraphState(n, adjacency, rng=rng.randrange(2 ** 32))
+    if trial % 2:
+      g.components()
+    for _ in range(150):
+      r, a, b = rng.random(), rng.randrange(n), rng.randrange(n)
+      if r < 0.3:
+        g.apply(rng.randrange(24), a)
+      elif r < 0.7 and a != b:
+        g.cz(a, b)
+      elif r < 0.8:
+        g.measure(a, rng.choice('XYZ'))
+      elif r < 0.85 and a != b and not g.has_edge(a, b):
+        g.add_edge(a, b)
+      elif r < 0.9 and a != b and g.has_edge(a, b):
+        g.remove_edge(a, b)
+      if rng.random() < 0.1:
+        expected = brute_force_components(g)
+        assert g.components() == expected
+        assert g.component(a) == next(c for c in expected if a in c)
+
+def test_split_and_merge():
+  rng = random.Random(2)
+  for _ in range(50):
+    n = rng.randint(1, 20)
+    g = GraphState(n, rng=rng.randrange(2 ** 32))
+    for _ in range(40):
+      a, b = rng.randrange(n), rng.randrange(n)
+      if a != b and rng.random() < 0.3:
+        g.cz(a, b)
+      else:
+        g.apply(rng.randrange(24), a)
+
+    parts = g.split()
+    assert [vertices for vertices, _ in parts] == g.components()
+
+    h = GraphState(n)
+    h.merge(parts)
+    assert bytes(h.vops) == bytes(g.vops) and list(h.edges()) == list(g.edges())
+
+    tracked = g.fork()
+    tracked.components()
+    tracked.merge([(vertices, state.fork()) for vertices, state in parts])
+    assert list(tracked.edges()) == list(g.edges())
+    assert tracked.components() == brute_force_components(g)
+
+def test_open_components_are_rejected():
+  g = GraphState(4)
+  g.add_edge(0, 1)
+  g.add_edge(1, 2)
+  with pytest.raises(ValueError):
+    g.substate([0, 1])
+  with pytest.raises(ValueError):
+    g.merge([([0, 1], GraphState(2))])
+  with pytest.raises(ValueError):
+    g.merge([([0, 1, 2], GraphState(2))])
+
+def test_run_components():
+  rng = random.Random(3)
+  for trial in range(40):
+    n = rng.randint(1, 12)
+    circuit = Circuit()
+    for _ in range(40):
+      a = rng.randrange(n)
+      r = rng.random()
+      if r < 0.4:
+        circuit.apply(rng.randrange(24), a)
+      elif r < 0.8:
+        b = min(n - 1, a // 3 * 3 + rng.randrange(3))
+        if a != b:
+          circuit.cz(a, b)
+      else:
+        circuit.measure(a, rng.choice('XYZ'))
+
+    g = GraphState(n)
+    results = run_components(g, circuit, seed=trial, workers=1)
+    assert len(results) == sum(1 for op in circuit.to_array() if op[0] == 2)
+    assert run_components(GraphState(n), circuit, seed=trial, workers=1).tolist() == results.tolist()
+    assert g.components() == brute_force_components(g)
+
+def test_run_components_in_parallel():
+  # Three independent groups of four qubits, each entangled and measured
+  circuit = Circuit()
+  for start in (0, 4, 8):
+    circuit.apply(10, start)
+    for q in range(start + 1, start + 4):
+      circuit.cz(start, q)
+    for q in range(start, start + 4):
+      circuit.measure(q, 'X')
+
+  serial, parallel = GraphState(12), GraphState(12)
+  expected = run_components(serial, circuit, seed=5, workers=1)
+  assert run_components(parallel, circuit, seed=5, workers=2).tolist() == expected.tolist()
+  assert bytes(parallel.vops) == bytes(serial.vops) and list(parallel.edges()) == list(serial.edges())
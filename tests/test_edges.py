@@ -0,0 +1,59 @@
+import random
+
+import numpy as np
+import pytest
+
+from graph_state import GraphState
+
+def random_graph_state(n, rng, adjacency):
+  g = GraphState(n, adjacency)
+  for _ in range(3 * n):
+    a, b = rng.randrange(n), rng.randrange(n)
+    g.apply(rng.randrange(24), a)
+    if a != b:
+      g.cz(a, b)
+  return g
+
+@pytest.mark.parametrize('adjacency', ['sparse', 'bitset'])
+def test_edges_and_edge_array(adjacency):
+  rng = random.Random(1)
+  for n in (0, 1, 2, 30, 200):
+    g = random_graph_state(n, rng, adjacency)
+    expected = sorted((a, b) for a in range(n) for b in g.neighbors(a) if a < b)
+
+    edges = g.edges()
+    assert iter(edges) is edges
+    assert list(edges) == expected
+
+    array = g.edge_array()
+    assert array.shape == (len(expected), 2) and array.dtype == np.int32
+    assert array.tolist() == [list(e) for e in expected]
+
+def test_to_networkx():
+  g = random_graph_state(20, random.Random(2), 'auto')
+  G = g.to_networkx()
+  assert sorted(G.nodes) == list(range(20))
+  assert sorted(tuple(sorted(e)) for e in G.edges) == [tuple(e) for e in g.edge_array().tolist()]
+  assert [G.nodes[a]['vop'] for a in range(20)] == g.vops.tolist()
+
+@pytest.mark.parametrize('adjacency', ['sparse', 'bitset'])
+def test_to_scipy_sparse(adjacency):
+  pytest.importorskip('scipy')
+  g = random_graph_state(50, random.Random(3), adjacency)
+  matrix = g.to_scipy_sparse()
+  assert matrix.shape == (50, 50)
+
+  dense = np.zeros((50, 50), dtype=np.uint8)
+  edges = g.edge_array()
+  dense[edges[:, 0], edges[:, 1]] = dense[edges[:, 1], edges[:, 0]] = 1
+  assert (matrix.toarray() == dense).all()
+
+def test_exports_of_a_loaded_state(tmp_path):
+  g = random_graph_state(50, random.Random(4), 'sparse')
+  g.save(str(tmp_path / 'state.gs'))
+  h = GraphState.load(str(tmp_path / 'state.gs'))
+  assert h.edge_array().tolist() == g.edge_array().tolist()
+  assert list(h.edges()) == list(g.edges())
+
+  pytest.importorskip('scipy')
+  assert (h.to_scipy_sparse() != g.to_scipy_sparse()).nnz == 0
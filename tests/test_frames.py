@@ -0,0 +1,45 @@
+import numpy as np
+
+from graph_state import Circuit
+from graph_state.frames import FrameSimulator, run_noisy_shots
+
+def bell_circuit():
+  circuit = Circuit()
+  circuit.h(0)
+  circuit.cx(0, 1)
+  circuit.measure(0)
+  circuit.measure(1)
+  circuit.x(2)
+  circuit.measure(2)
+  circuit.measure(2, 'X')
+  return circuit
+
+def test_noiseless():
+  results = run_noisy_shots(3, bell_circuit(), 1000, seed=1)
+  assert results.shape == (1000, 4)
+  assert (results[:, 0] == results[:, 1]).all()
+  assert 0.4 < results[:, 0].mean() < 0.6
+  assert (results[:, 2] == 1).all()
+  assert 0.4 < results[:, 3].mean() < 0.6
+
+def test_measurement_noise():
+  results = run_noisy_shots(3, bell_circuit(), 4000, measure_flip=0.1, seed=2)
+  assert 0.15 < (results[:, 0] != results[:, 1]).mean() < 0.21
+  assert 0.07 < 1 - results[:, 2].mean() < 0.13
+
+def test_chunks_without_measurements():
+  gates = Circuit()
+  gates.h(0)
+  assert run_noisy_shots(2, gates, 100).shape == (100, 0)
+
+  simulator = FrameSimulator(2, 100, depolarize=0.01, seed=3)
+  assert simulator.run(gates, packed=True).shape == (0, 2)
+  measure = Circuit()
+  measure.measure(0, 'X')
+  assert simulator.run(measure).shape == (100, 1)
+
+def test_packed_matches_unpacked():
+  a = FrameSimulator(3, 130, depolarize=0.05, seed=4).run(bell_circuit())
+  b = FrameSimulator(3, 130, depolarize=0.05, seed=4).run(bell_circuit(), packed=True)
+  bits = np.unpackbits(b.view(np.uint8), axis=1, bitorder='little')[:, :130].T
+  assert (a == bits).all()
@@ -0,0 +1,48 @@
+import random
+
+import numpy as np
+import pytest
+
+import statevector as sv
+
+BACKENDS = ['sparse', 'bitset']
+
+@pytest.mark.parametrize('adjacency', BACKENDS)
+def test_gates_and_measurements(adjacency):
+  rng = random.Random(1)
+  for _ in range(100):
+    n = rng.randint(2, 6)
+    g, psi = sv.random_state(n, 0, rng, adjacency)
+    for _ in range(30):
+      r = rng.random()
+      if r < 0.45:
+        a, b = rng.sample(range(n), 2)
+        g.cz(a, b)
+        psi = sv.cz(psi, a, b, n)
+      elif r < 0.8:
+        vop, q = rng.randrange(24), rng.randrange(n)
+        g.apply(vop, q)
+        psi = sv.apply(psi, sv.VOP_MATRICES[vop], q, n)
+      else:
+        q, basis = rng.randrange(n), rng.choice('XYZ')
+        outcome = g.measure(q, basis)
+        psi, p = sv.measure(psi, q, basis, outcome, n)
+        assert psi is not None
+      assert sv.same_state(sv.graph_vector(g), psi)
+
+@pytest.mark.parametrize('adjacency', BACKENDS)
+def test_named_gates(adjacency):
+  s = np.diag([1, 1j])
+  h = (sv.X + sv.Z) / np.sqrt(2)
+  gates = {'h': h, 'x': sv.X, 'y': sv.Y, 'z': sv.Z, 's': s, 's_dagger': s.conj()}
+
+  rng = random.Random(2)
+  g, psi = sv.random_state(3, 10, rng, adjacency)
+  for _ in range(50):
+    name, q = rng.choice(sorted(gates)), rng.randrange(3)
+    getattr(g, name)(q)
+    psi = sv.apply(psi, gates[name], q, 3)
+    a, b = rng.sample(range(3), 2)
+    g.cx(a, b)
+    psi = sv.apply(sv.cz(sv.apply(psi, h, b, 3), a, b, 3), h, b, 3)
+    assert sv.same_state(sv.graph_vector(g), psi)
@@ -0,0 +1,37 @@
+import random
+
+import numpy as np
+import pytest
+
+from graph_state import GraphState
+
+import statevector as sv
+
+def test_expectation():
+  rng = random.Random(6)
+  for _ in range(60):
+    n = rng.randint(1, 5)
+    g, psi = sv.random_state(n, rng.randint(0, 25), rng)
+    paulis = [rng.choice('+-') + ''.join(rng.choice('IXYZ') for _ in range(n)) for _ in range(20)]
+    expected = [int(round(np.vdot(psi, sv.pauli_matrix(p) @ psi).real)) for p in paulis]
+
+    assert [g.expectation(p) for p in paulis] == expected
+    assert g.expectations(paulis).tolist() == expected
+
+    for q in range(n):
+      for basis in 'XYZ':
+        value = np.vdot(psi, sv.apply(psi, sv.PAULI_MATRICES[basis], q, n)).real
+        peek = g.peek_measure(q, basis)
+        assert peek == ('random' if abs(value) < 0.5 else int(value < 0))
+        assert g.peek_measures([q], basis)[0] == (-1 if peek == 'random' else peek)
+
+def test_expectation_dict_and_errors():
+  g = GraphState(3)
+  g.h(0)
+  g.cx(0, 1)
+  assert g.expectation({0: 'Z', 1: 'Z'}) == 1
+  assert g.expectation('XXI') == 1
+  assert g.expectation('-YYI') == 1
+  assert g.expectation('ZII') == 0
+  with pytest.raises(ValueError):
+    g.expectation('XQ')
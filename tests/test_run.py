@@ -0,0 +1,64 @@
+import random
+
+import numpy as np
+
+from graph_state import GraphState, Circuit
+
+import statevector as sv
+
+def random_circuit(n, length, rng):
+  circuit = Circuit()
+  for _ in range(length):
+    r, q = rng.random(), rng.randrange(n)
+    if r < 0.5:
+      circuit.apply(rng.randrange(24), q)
+    elif r < 0.8 and n > 1:
+      circuit.cz(q, rng.choice([a for a in range(n) if a != q]))
+    else:
+      circuit.measure(q, rng.choice('XYZ'))
+  return circuit
+
+def test_run_matches_per_gate():
+  rng = random.Random(4)
+  for _ in range(50):
+    n = rng.randint(1, 8)
+    circuit = random_circuit(n, 60, rng)
+
+    seed = rng.randrange(2 ** 32)
+    g = GraphState(n, rng=seed)
+    results = g.run(circuit)
+
+    h = GraphState(n, rng=seed)
+    expected = []
+    for opcode, a, b in circuit.to_array().tolist():
+      if opcode == 0:
+        h.apply(b, a)
+      elif opcode == 1:
+        h.cz(a, b)
+      else:
+        expected.append(h.measure(a, 'XYZ'[b - 1]))
+
+    assert results.tolist() == expected
+    assert sv.same_state(sv.graph_vector(g), sv.graph_vector(h))
+
+def test_run_arrays_and_chunks():
+  rng = random.Random(5)
+  n = 6
+  circuit = random_circuit(n, 200, rng)
+  ops = circuit.to_array()
+
+  g = GraphState(n, rng=7)
+  whole = g.run(ops)
+
+  h = GraphState(n, rng=7)
+  chunks = [h.run(ops[start:start + 17]) for start in range(0, len(ops), 17)]
+  assert np.concatenate(chunks).tolist() == whole.tolist()
+  assert bytes(h.vops) == bytes(g.vops) and list(h.edges()) == list(g.edges())
+
+def test_run_leaves_other_qubits_alone():
+  g = GraphState(10 ** 5)
+  circuit = Circuit()
+  circuit.h(3)
+  circuit.s(3)
+  assert len(g.run(circuit)) == 0
+  assert g.vops[3] != 10 and (np.delete(g.vops, 3) == 10).all()
@@ -0,0 +1,70 @@
+import random
+from collections import Counter
+
+import pytest
+
+from graph_state import GraphState
+
+import statevector as sv
+
+BACKENDS = ['sparse', 'bitset']
+
+@pytest.mark.parametrize('adjacency', BACKENDS)
+def test_forced_measurement(adjacency):
+  rng = random.Random(3)
+  for _ in range(100):
+    n = rng.randint(1, 5)
+    g, psi = sv.random_state(n, 15, rng, adjacency)
+    q, basis, force = rng.randrange(n), rng.choice('XYZ'), rng.randint(0, 1)
+    deterministic = g.is_deterministic(q, basis)
+    outcome = g.measure(q, basis, force=force)
+    after, p = sv.measure(psi, q, basis, outcome, n)
+    assert after is not None
+    assert deterministic == (abs(p - 1) < 1e-9)
+    if not deterministic:
+      assert outcome == force
+
+def test_sample_distribution():
+  rng = random.Random(5)
+  shots = 2000
+  for _ in range(40):
+    n = rng.randint(2, 6)
+    g, psi = sv.random_state(n, rng.randint(0, 25), rng, rng.choice(BACKENDS))
+    targets = rng.sample(range(n), rng.randint(1, n))
+    bases = [rng.choice('XYZ') for _ in targets]
+    vops, edges = g.vops.copy(), list(g.edges())
+
+    samples = g.sample(targets, shots, bases)
+    assert samples.shape == (shots, len(targets))
+    assert (g.vops == vops).all() and list(g.edges()) == edges
+
+    expected = sv.distribution(psi, targets, bases, n)
+    counts = Counter(map(tuple, samples.tolist()))
+    assert set(counts) <= set(expected)
+    for outcomes, p in expected.items():
+      assert abs(counts[outcomes] / shots - p) < 0.06
+
+@pytest.mark.parametrize('adjacency', BACKENDS)
+def test_fork_is_independent(adjacency):
+  rng = random.Random(7)
+  g, psi = sv.random_state(5, 30, rng, adjacency)
+  vops, edges = bytes(g.vops), list(g.edges())
+
+  f = g.fork()
+  for _ in range(30):
+    a, b = rng.sample(range(5), 2)
+    f.cz(a, b)
+    f.apply(rng.randrange(24), a)
+  f.measure(0, 'X')
+
+  assert bytes(g.vops) == vops and list(g.edges()) == edges
+  assert sv.same_state(sv.graph_vector(g), psi)
+
+def test_sample_edge_cases():
+  g = GraphState(3, rng=1)
+  g.h(0)
+  g.cx(0, 1)
+  assert g.sample([], 5).shape == (5, 0)
+  assert g.sample([0, 1], 0).shape == (0, 2)
+  few = g.sample([0, 1, 0], 2)
+  assert (few[:, 0] == few[:, 1]).all() and (few[:, 0] == few[:, 2]).all()
@@ -0,0 +1,43 @@
+import random
+
+import numpy as np
+
+from graph_state import GraphState, Circuit, run_shots
+from graph_state import shots
+
+def ghz_circuit(n):
+  circuit = Circuit()
+  circuit.h(0)
+  for a in range(1, n):
+    circuit.cx(0, a)
+  for a in range(n):
+    circuit.measure(a, 'X' if a % 2 else 'Z')
+  return circuit
+
+def test_workers_do_not_change_results():
+  circuit = ghz_circuit(4)
+  serial = run_shots(4, circuit, 300, seed=11, workers=1, chunk_size=64)
+  parallel = run_shots(4, circuit, 300, seed=11, workers=2, chunk_size=64)
+  assert serial.shape == (300, 4)
+  assert (serial == parallel).all()
+  assert not (serial == run_shots(4, circuit, 300, seed=12, workers=1, chunk_size=64)).all()
+
+def test_serial_run_releases_the_circuit():
+  run_shots(3, ghz_circuit(3), 10, seed=1, workers=1)
+  assert shots.worker_job == {}
+
+def test_rng_kinds():
+  for rng in (5, random.Random(5), np.random.default_rng(5)):
+    g = GraphState(3, rng=rng)
+    g.h(0)
+    g.cx(0, 1)
+    outcomes = g.sample([0, 1], 500)
+    assert (outcomes[:, 0] == outcomes[:, 1]).all()
+    assert 0.4 < outcomes[:, 0].mean() < 0.6
+    assert g.measure(2) == 0
+
+  a, b = GraphState(8, rng=np.random.default_rng(3)), GraphState(8, rng=np.random.default_rng(3))
+  for g in (a, b):
+    for q in range(8):
+      g.h(q)
+  assert [a.measure(q) for q in range(8)] == [b.measure(q) for q in range(8)]
@@ -0,0 +1,64 @@
+from graph_state import GraphState, Circuit
+
+def test_run_counts_folded_gates():
+  circuit = Circuit()
+  circuit.h(0)
+  circuit.h(0)
+  circuit.s(1)
+  circuit.cz(0, 1)
+  circuit.measure(0)
+
+  g = GraphState(2)
+  stats = g.enable_stats()
+  g.run(circuit)
+  assert stats.gates == {'h': 2, 's': 1, 'cz': 1, 'measure_Z': 1}
+
+def test_edge_removals_are_counted():
+  # A star graph state with identity VOPs, so that measuring the centre
+  # in Z removes its 5 edges and nothing else
+  g = GraphState(6)
+  for a in range(6):
+    g.h(a)
+  for a in range(1, 6):
+    g.add_edge(0, a)
+
+  stats = g.enable_stats()
+  g.measure(0, 'Z')
+  assert g.degree(0) == 0
+  assert stats.edge_toggles == 5
+
+def test_disable_stats():
+  g = GraphState(3)
+  g.enable_stats()
+  g.disable_stats()
+  assert not set(g.__dict__) & {'apply', 'cz', 'measure'}
+  assert not set(g.adjacency.__dict__) & {'add_edge', 'remove_edge', 'toggle_edge'}
+
+def test_local_complementations_are_counted_by_times():
+  g = GraphState(3)
+  for a in range(3):
+    g.h(a)
+  g.add_edge(0, 1)
+  g.add_edge(1, 2)
+
+  stats = g.enable_stats()
+  g.local_complementation(1, 3)
+  g.local_complementation(0, 2)
+  g.local_complementation(2, 4)
+  # The first complementation closes the triangle, so every degree is 2
+  assert stats.local_complementations == 5
+  assert stats.neighborhood_sizes == {2: 5}
+
+def test_reduce_vop_counts():
+  # VOP 2 decomposes as ZZXX: two complementations of a neighbour, two of the vertex
+  g = GraphState(3)
+  for a in range(3):
+    g.h(a)
+  g.add_edge(0, 1)
+  g.add_edge(0, 2)
+  g.apply(2, 0)
+
+  stats = g.enable_stats()
+  g.reduce_vop(0, 1)
+  assert g.vops[0] == 0
+  assert stats.local_complementations == 4
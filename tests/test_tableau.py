@@ -0,0 +1,82 @@
+import random
+
+import numpy as np
+
+from graph_state import GraphState
+from tableau import Tableau
+
+import statevector as sv
+
+def test_matches_graph_state():
+  rng = random.Random(1)
+  for _ in range(60):
+    n = rng.randint(1, 9) if rng.random() < 0.8 else rng.randint(60, 140)
+    g = GraphState(n, rng=rng.randrange(2 ** 32))
+    t = Tableau(n)
+    for _ in range(60):
+      r, q = rng.random(), rng.randrange(n)
+      if r < 0.4 and n > 1:
+        b = rng.choice([a for a in range(n) if a != q])
+        if rng.random() < 0.5:
+          g.cz(q, b)
+          t.cz(q, b)
+        else:
+          g.cx(q, b)
+          t.cx(q, b)
+      elif r < 0.85:
+        vop = rng.randrange(24)
+        g.apply(vop, q)
+        t.apply(vop, q)
+      else:
+        basis = rng.choice('XYZ')
+        outcome = g.measure(q, basis)
+        assert t.measure(q, basis, force=outcome) == outcome
+
+    assert Tableau.from_graph_state(g) == t
+    assert Tableau.from_graph_state(t.to_graph_state()) == t
+
+def test_stabilizers():
+  rng = random.Random(2)
+  paulis = {(0, 0): sv.I, (1, 0): sv.X, (0, 1): sv.Z, (1, 1): sv.Y}
+  for _ in range(40):
+    n = rng.randint(1, 5)
+    g = GraphState(n)
+    for _ in range(20):
+      if n > 1 and rng.random() < 0.5:
+        g.cz(*rng.sample(range(n), 2))
+      else:
+        g.apply(rng.randrange(24), rng.randrange(n))
+
+    psi = sv.graph_vector(g)
+    for row in Tableau.from_graph_state(g).bits()[n:]:
+      stabilizer = np.array([[1]])
+      for q in range(n):
+        stabilizer = np.kron(stabilizer, paulis[row[q], row[n + q]])
+      assert np.allclose((-1) ** int(row[-1]) * stabilizer @ psi, psi)
+
+def test_measurements():
+  # GHZ state across the word boundary, with X results from a second copy
+  n = 70
+  t = Tableau(n, rng=1)
+  t.h(0)
+  for a in range(1, n):
+    t.cx(0, a)
+  ghz = Tableau.from_graph_state(t.to_graph_state())
+
+  first = t.measure(0)
+  assert all(t.measure(a) == first for a in range(n))
+  assert t.measure(69, force=1 - first) == first
+
+  parity = sum(ghz.measure(a, 'X') for a in range(n)) % 2
+  assert parity == 0
+
+def test_equality():
+  a, b = Tableau(3), Tableau(3)
+  a.h(0)
+  b.h(0)
+  assert a == b
+  b.z_gate(0)
+  assert a != b
+  a.z_gate(0)
+  a.cz(1, 2)
+  assert a == b